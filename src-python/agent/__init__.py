@@ -1,33 +1,57 @@
-"""Excel Agent Core Package."""
-
-from agent.config import AgentConfig
-from agent.core import AgentCore
-from agent.events import (
-    AgentEvent,
-    ErrorEvent,
-    EventType,
-    QueryEndEvent,
-    QueryStartEvent,
-    RefusalEvent,
-    TextEvent,
-    ThinkingEvent,
-    ToolCallArgsEvent,
-    ToolCallStartEvent,
-    ToolResultEvent,
-)
-
-__all__ = [
-    "AgentCore",
-    "AgentConfig",
-    "AgentEvent",
-    "EventType",
-    "ThinkingEvent",
-    "TextEvent",
-    "RefusalEvent",
-    "ToolCallStartEvent",
-    "ToolCallArgsEvent",
-    "ToolResultEvent",
-    "ErrorEvent",
-    "QueryStartEvent",
-    "QueryEndEvent",
-]
+"""Excel Agent Core Package.
+
+Exports are resolved lazily (PEP 562) so importing a light submodule such as
+agent.config or agent.logging_config does not pull in the langgraph/langchain
+stack behind AgentCore.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY_MAP: dict[str, str] = {
+    "AgentCore": "agent.core",
+    "AgentConfig": "agent.config",
+    "AgentEvent": "agent.events",
+    "EventType": "agent.events",
+    "ThinkingEvent": "agent.events",
+    "TextEvent": "agent.events",
+    "RefusalEvent": "agent.events",
+    "ToolCallStartEvent": "agent.events",
+    "ToolCallArgsEvent": "agent.events",
+    "ToolResultEvent": "agent.events",
+    "ErrorEvent": "agent.events",
+    "QueryStartEvent": "agent.events",
+    "QueryEndEvent": "agent.events",
+}
+
+__all__ = list(_LAZY_MAP)
+
+if TYPE_CHECKING:
+    from agent.config import AgentConfig
+    from agent.core import AgentCore
+    from agent.events import (
+        AgentEvent,
+        ErrorEvent,
+        EventType,
+        QueryEndEvent,
+        QueryStartEvent,
+        RefusalEvent,
+        TextEvent,
+        ThinkingEvent,
+        ToolCallArgsEvent,
+        ToolCallStartEvent,
+        ToolResultEvent,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
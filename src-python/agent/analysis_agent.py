@@ -8,9 +8,14 @@ summary. Results are written to .excel-agent/schema/<source_name>.md
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import hashlib
+import json
 import logging
 import os
+import re
+import time
 from pathlib import Path
 from typing import Any, Optional
 
@@ -314,12 +319,35 @@ async def _format_with_llm(raw_structure: str, model_spec: str, api_key: str, pr
 # ── Public entry point ────────────────────────────────────────────────────────
 
 SCHEMA_DIR_NAME = "schema"
+# Formatted output per (model, raw structure); the formatting call runs at
+# temperature 0, so with response_cache_enabled an unchanged source need not
+# go back to the LLM
+LLM_CACHE_NAME = "llm_cache.json"
+
+# Formatting calls in flight at once; provider quotas (e.g. zhipu) reject
+# larger bursts with 429s, which _format_with_llm turns into raw fallbacks
+_LLM_CONCURRENCY = 3
+
+
+def _cache_key(model_spec: str, raw_structure: str) -> str:
+    text = f"{model_spec}|{_SYSTEM_PROMPT}|{raw_structure}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _load_llm_cache(path: Path) -> dict[str, str]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/:*?"<>|]')
 
 
 def _safe_filename(name: str) -> str:
     """Convert a data source name to a safe filename."""
-    import re
-    return re.sub(r'[\\/:*?"<>|]', "_", name)
+    return _UNSAFE_FILENAME_RE.sub("_", name)
 
 
 async def run_analysis(
@@ -328,9 +356,17 @@ async def run_analysis(
     api_key: str,
     provider: str,
     project_root: Optional[Path],
+    response_cache_enabled: bool = False,
 ) -> str:
-    """Analyze all data sources, write per-source schema files, return summary markdown."""
-    import time
+    """Analyze all data sources, write per-source schema files, return summary markdown.
+
+    Workbooks are read one at a time on the COM thread while the LLM
+    formatting calls for earlier sources run concurrently on the event loop,
+    at most _LLM_CONCURRENCY at once.
+    With *response_cache_enabled*, formatting results are reused from
+    llm_cache.json for sources whose raw structure has not changed.
+    """
+    from libs.excel_com.com_thread import arun_on_com_thread
     from libs.excel_com.instance_manager import ExcelInstanceManager  # type: ignore[import]
 
     logger.info("Analysis started: %d source(s), model=%s, project=%s",
@@ -345,22 +381,32 @@ async def run_analysis(
         schema_dir.mkdir(parents=True, exist_ok=True)
         logger.debug("Schema dir: %s", schema_dir)
 
-    summary_lines: list[str] = []
     use_llm = bool(model_spec and model_spec.strip())
-
-    for source in data_sources:
-        t0 = time.perf_counter()
-        logger.debug("Analyzing source: name=%s type=%s path=%s", source.name, source.type, source.path)
-
-        try:
-            raw = _build_raw_structure([source], mgr)
-            logger.debug("Raw structure built: source=%s chars=%d", source.name, len(raw))
-        except Exception as e:
-            logger.error("Failed to build raw structure for %s: %s", source.name, e)
-            raw = f"Error reading {source.name}: {e}"
-
-        if use_llm:
-            content = await _format_with_llm(raw, model_spec, api_key, provider)
+    use_cache = use_llm and response_cache_enabled and schema_dir is not None
+    llm_cache: dict[str, str] = {}
+    if use_cache:
+        llm_cache = _load_llm_cache(schema_dir / LLM_CACHE_NAME)
+    # Only entries for this run's sources are written back
+    fresh_cache: dict[str, str] = {}
+    llm_slots = asyncio.Semaphore(_LLM_CONCURRENCY)
+
+    async def _format(raw: str) -> str:
+        async with llm_slots:
+            return await _format_with_llm(raw, model_spec, api_key, provider)
+
+    async def _analyze_source(source: Any, raw: str, t0: float) -> str:
+        if use_cache:
+            key = _cache_key(model_spec, raw)
+            content = llm_cache.get(key)
+            if content is not None:
+                logger.debug("LLM format cache hit: source=%s", source.name)
+            else:
+                content = await _format(raw)
+            # _format_with_llm falls back to the raw text on failure; don't cache that
+            if content != raw:
+                fresh_cache[key] = content
+        elif use_llm:
+            content = await _format(raw)
         else:
             content = raw
 
@@ -370,8 +416,7 @@ async def run_analysis(
 
         # Write per-source schema file
         if schema_dir is not None:
-            fname = _safe_filename(source.name) + ".md"
-            schema_file = schema_dir / fname
+            schema_file = schema_dir / (_safe_filename(source.name) + ".md")
             schema_file.write_text(content, encoding="utf-8")
             logger.debug("Schema written: %s", schema_file)
 
@@ -381,20 +426,44 @@ async def run_analysis(
         # Use absolute path to schema file in summary
         if schema_dir is not None:
             schema_abs = str(schema_dir / (_safe_filename(source.name) + ".md"))
-            summary_lines.append(
+            return (
                 f"- **{source.name}** (`{source.type}`) "
                 f"| file: `{abs_path}` "
                 f"| schema: `{schema_abs}`"
             )
-        else:
-            summary_lines.append(f"- **{source.name}** (`{source.type}`) | file: `{abs_path}`")
+        return f"- **{source.name}** (`{source.type}`) | file: `{abs_path}`"
 
+    # A failing task (e.g. an unwritable schema file) cancels the others
+    tasks: list[asyncio.Task[str]] = []
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for source in data_sources:
+                t0 = time.perf_counter()
+                logger.debug("Analyzing source: name=%s type=%s path=%s", source.name, source.type, source.path)
+
+                try:
+                    raw = await arun_on_com_thread(_build_raw_structure, [source], mgr, timeout=120.0)
+                    logger.debug("Raw structure built: source=%s chars=%d", source.name, len(raw))
+                except Exception as e:
+                    logger.error("Failed to build raw structure for %s: %s", source.name, e)
+                    raw = f"Error reading {source.name}: {e}"
+
+                tasks.append(tg.create_task(_analyze_source(source, raw, t0)))
+    except ExceptionGroup as eg:
+        # Report the failure itself rather than the group wrapper
+        raise eg.exceptions[0] from eg
+
+    summary_lines = [task.result() for task in tasks]
     summary = "\n".join(summary_lines)
 
     # Write summary.md
     if schema_dir is not None:
         (schema_dir / "summary.md").write_text(summary, encoding="utf-8")
         logger.debug("Summary written: %s", schema_dir / "summary.md")
+        if use_cache:
+            (schema_dir / LLM_CACHE_NAME).write_text(
+                json.dumps(fresh_cache, ensure_ascii=False), encoding="utf-8"
+            )
 
     logger.info("Analysis complete: %d source(s) processed", len(data_sources))
     return summary
@@ -3,13 +3,27 @@
 import json
 import logging
 import time
-from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
+# invocation_params keys copied into the request log
+_LOGGED_PARAM_KEYS = frozenset({"model", "model_name", "temperature", "stream"})
+
+
+class _LazyJson:
+    """Defers json.dumps until the log record is actually formatted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        return json.dumps(self.data, indent=2, ensure_ascii=False, default=str)
+
 
 class LLMLoggingCallbackHandler(BaseCallbackHandler):
     def __init__(
@@ -23,103 +37,33 @@ class LLMLoggingCallbackHandler(BaseCallbackHandler):
         self.log_full_prompt = log_full_prompt
         self.log_token_usage = log_token_usage
         self.log_timing = log_timing
-        self._call_start_times: dict[str, float] = {}
-        self._call_prompts: dict[str, list] = {}
+        self._call_start_times: dict[UUID, float] = {}
 
     def on_chat_model_start(
         self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any
     ) -> None:
-        run_id_str = str(run_id)
-        self._call_start_times[run_id_str] = time.perf_counter()
-        self._call_prompts[run_id_str] = messages
-
-        log_data: dict[str, Any] = {
-            "event": "llm_start",
-            "timestamp": datetime.now().isoformat(),
-            "run_id": run_id_str,
-        }
-
-        if self.log_full_prompt:
-            prompt_content = []
-            for msg_list in messages:
-                for msg in msg_list:
-                    prompt_content.append(
-                        {
-                            "type": msg.__class__.__name__,
-                            "content": getattr(msg, "content", str(msg)),
-                        }
-                    )
-            log_data["prompt"] = prompt_content
-
-        if "invocation_params" in kwargs:
-            params = kwargs["invocation_params"]
-            log_data["model_params"] = {
-                k: v
-                for k, v in params.items()
-                if k in ["model", "model_name", "temperature", "stream"]
-            }
-
-        self.logger.debug(
-            f"LLM Request:\n{json.dumps(log_data, indent=2, ensure_ascii=False, default=str)}"
+        self._log_start(
+            run_id,
+            lambda: [
+                {
+                    "type": msg.__class__.__name__,
+                    "content": getattr(msg, "content", str(msg)),
+                }
+                for msg_list in messages
+                for msg in msg_list
+            ],
+            kwargs,
         )
 
     def on_chat_model_end(
         self, response: LLMResult, *, run_id: UUID, **kwargs: Any
     ) -> None:
-        run_id_str = str(run_id)
-        start_time = self._call_start_times.pop(run_id_str, None)
-
-        log_data: dict[str, Any] = {
-            "event": "llm_end",
-            "timestamp": datetime.now().isoformat(),
-            "run_id": run_id_str,
-        }
-
-        if self.log_timing and start_time:
-            log_data["elapsed_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
-
-        if response.generations:
-            log_data["response"] = [
-                {"text": gen.text}
-                for gen_list in response.generations
-                for gen in gen_list
-            ]
-
-        if self.log_token_usage and response.llm_output:
-            token_usage = response.llm_output.get("token_usage", {})
-            if token_usage:
-                log_data["token_usage"] = {
-                    "prompt_tokens": token_usage.get("prompt_tokens"),
-                    "completion_tokens": token_usage.get("completion_tokens"),
-                    "total_tokens": token_usage.get("total_tokens"),
-                }
-
-        self.logger.debug(
-            f"LLM Response:\n{json.dumps(log_data, indent=2, ensure_ascii=False, default=str)}"
-        )
-        self._call_prompts.pop(run_id_str, None)
+        self._log_end(run_id, response)
 
     def on_chat_model_error(
         self, error: BaseException, *, run_id: UUID, **kwargs: Any
     ) -> None:
-        run_id_str = str(run_id)
-        start_time = self._call_start_times.pop(run_id_str, None)
-
-        log_data: dict[str, Any] = {
-            "event": "llm_error",
-            "timestamp": datetime.now().isoformat(),
-            "run_id": run_id_str,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-        }
-
-        if self.log_timing and start_time:
-            log_data["elapsed_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
-
-        self.logger.error(
-            f"LLM Error:\n{json.dumps(log_data, indent=2, ensure_ascii=False, default=str)}"
-        )
-        self._call_prompts.pop(run_id_str, None)
+        self._log_error(run_id, error)
 
     def on_llm_start(
         self,
@@ -129,39 +73,56 @@ class LLMLoggingCallbackHandler(BaseCallbackHandler):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
-        run_id_str = str(run_id)
-        self._call_start_times[run_id_str] = time.perf_counter()
-        self._call_prompts[run_id_str] = prompts
+        self._log_start(
+            run_id,
+            lambda: [{"type": "prompt", "content": p} for p in prompts],
+            kwargs,
+        )
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._log_end(run_id, response)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._log_error(run_id, error)
+
+    # ── shared bodies ─────────────────────────────────────────────────────────
+
+    def _log_start(
+        self,
+        run_id: UUID,
+        build_prompt: Callable[[], list[dict[str, Any]]],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self._call_start_times[run_id] = time.perf_counter()
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
 
         log_data: dict[str, Any] = {
             "event": "llm_start",
-            "timestamp": datetime.now().isoformat(),
-            "run_id": run_id_str,
+            "run_id": str(run_id),
         }
 
         if self.log_full_prompt:
-            log_data["prompt"] = [{"type": "prompt", "content": p} for p in prompts]
+            log_data["prompt"] = build_prompt()
 
         if "invocation_params" in kwargs:
             params = kwargs["invocation_params"]
             log_data["model_params"] = {
-                k: v
-                for k, v in params.items()
-                if k in ["model", "model_name", "temperature", "stream"]
+                k: v for k, v in params.items() if k in _LOGGED_PARAM_KEYS
             }
 
-        self.logger.debug(
-            f"LLM Request:\n{json.dumps(log_data, indent=2, ensure_ascii=False, default=str)}"
-        )
+        self.logger.debug("LLM Request:\n%s", _LazyJson(log_data))
 
-    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
-        run_id_str = str(run_id)
-        start_time = self._call_start_times.pop(run_id_str, None)
+    def _log_end(self, run_id: UUID, response: LLMResult) -> None:
+        start_time = self._call_start_times.pop(run_id, None)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
 
         log_data: dict[str, Any] = {
             "event": "llm_end",
-            "timestamp": datetime.now().isoformat(),
-            "run_id": run_id_str,
+            "run_id": str(run_id),
         }
 
         if self.log_timing and start_time:
@@ -183,21 +144,16 @@ class LLMLoggingCallbackHandler(BaseCallbackHandler):
                     "total_tokens": token_usage.get("total_tokens"),
                 }
 
-        self.logger.debug(
-            f"LLM Response:\n{json.dumps(log_data, indent=2, ensure_ascii=False, default=str)}"
-        )
-        self._call_prompts.pop(run_id_str, None)
+        self.logger.debug("LLM Response:\n%s", _LazyJson(log_data))
 
-    def on_llm_error(
-        self, error: BaseException, *, run_id: UUID, **kwargs: Any
-    ) -> None:
-        run_id_str = str(run_id)
-        start_time = self._call_start_times.pop(run_id_str, None)
+    def _log_error(self, run_id: UUID, error: BaseException) -> None:
+        start_time = self._call_start_times.pop(run_id, None)
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
 
         log_data: dict[str, Any] = {
             "event": "llm_error",
-            "timestamp": datetime.now().isoformat(),
-            "run_id": run_id_str,
+            "run_id": str(run_id),
             "error_type": type(error).__name__,
             "error_message": str(error),
         }
@@ -205,7 +161,4 @@ class LLMLoggingCallbackHandler(BaseCallbackHandler):
         if self.log_timing and start_time:
             log_data["elapsed_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
 
-        self.logger.error(
-            f"LLM Error:\n{json.dumps(log_data, indent=2, ensure_ascii=False, default=str)}"
-        )
-        self._call_prompts.pop(run_id_str, None)
+        self.logger.error("LLM Error:\n%s", _LazyJson(log_data))
@@ -0,0 +1,92 @@
+"""Process-wide checkpointers shared across sessions and cached graphs."""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import MemorySaver
+
+logger = logging.getLogger("app.agent")
+
+# Threads kept in memory before the least recently written one is dropped
+MAX_THREADS = 128
+
+
+class BoundedMemorySaver(MemorySaver):
+    """MemorySaver that evicts the least recently written thread.
+
+    A plain MemorySaver keeps every thread's checkpoints for the life of the
+    process; this one deletes the oldest thread once more than *max_threads*
+    have been written.
+    """
+
+    def __init__(self, max_threads: int = MAX_THREADS) -> None:
+        super().__init__()
+        self.max_threads = max_threads
+        self._threads: OrderedDict[str, None] = OrderedDict()
+        self._threads_lock = threading.Lock()
+
+    def put(self, config: RunnableConfig, *args: Any, **kwargs: Any) -> RunnableConfig:
+        # aput delegates here, so both paths are tracked
+        result = super().put(config, *args, **kwargs)
+        self._touch(config["configurable"]["thread_id"])
+        return result
+
+    def _touch(self, thread_id: str) -> None:
+        evicted: list[str] = []
+        with self._threads_lock:
+            self._threads[thread_id] = None
+            self._threads.move_to_end(thread_id)
+            while len(self._threads) > self.max_threads:
+                evicted.append(self._threads.popitem(last=False)[0])
+        for old in evicted:
+            self.delete_thread(old)
+
+
+_shared_saver: Optional[BoundedMemorySaver] = None
+
+
+def get_shared_memory_saver() -> BoundedMemorySaver:
+    """Return the process-wide saver used when no checkpoint_path is set."""
+    global _shared_saver
+    if _shared_saver is None:
+        _shared_saver = BoundedMemorySaver()
+    return _shared_saver
+
+
+# One AsyncSqliteSaver per checkpoint file, open until close_sqlite_savers()
+_sqlite_savers: dict[str, Any] = {}
+
+
+def get_sqlite_saver(path: Path) -> Any:
+    """Return the saver for the checkpoint file at *path*, creating it once.
+
+    Must be called with the event loop running (AsyncSqliteSaver binds to
+    it); the aiosqlite connection is opened lazily on first use, and
+    ``setup()`` switches the database to WAL mode. Graphs rebuilt for the
+    same project share the saver, so dropping a graph never closes a
+    connection another stream still uses.
+    """
+    key = str(path)
+    saver = _sqlite_savers.get(key)
+    if saver is None:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        saver = _sqlite_savers[key] = AsyncSqliteSaver(aiosqlite.connect(key))
+    return saver
+
+
+async def close_sqlite_savers() -> None:
+    """Close every checkpoint connection; called at server shutdown."""
+    savers = list(_sqlite_savers.values())
+    _sqlite_savers.clear()
+    for saver in savers:
+        try:
+            await saver.conn.close()
+        except Exception as e:
+            logger.warning("Closing checkpoint connection failed: %s", e)
@@ -1,15 +1,37 @@
 """Agent configuration."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Optional
 import uuid
 
-from langchain_core.language_models import BaseChatModel
-
 if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
     from tools.base import ToolProvider
 
+# __file__ is src-python/agent/config.py; parents[2] is the project root
+_APP_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_AGENTS_MD_PATH = _APP_ROOT / "AGENTS.md"
+DEFAULT_SKILLS_PATH = _APP_ROOT / "skills"
+
+# The bundled AGENTS.md/skills ship with the app, so stat them once; project
+# paths are still checked per config since they can appear at runtime.
+_BUNDLED_PATHS: dict[Path, bool] = {
+    p: p.exists() for p in (DEFAULT_AGENTS_MD_PATH, DEFAULT_SKILLS_PATH)
+}
+
+
+def _existing_paths(*paths: Optional[Path]) -> Optional[list[str]]:
+    """Return existing *paths* as strings in a stable order, or None."""
+    found = sorted(
+        str(p)
+        for p in paths
+        if p and (_BUNDLED_PATHS[p] if p in _BUNDLED_PATHS else p.exists())
+    )
+    return found or None
+
 
 @dataclass
 class LoggingConfig:
@@ -24,27 +46,41 @@ class LoggingConfig:
 
 @dataclass
 class AgentConfig:
-    model: str | BaseChatModel = "zhipu:glm-4.7"
+    model: "str | BaseChatModel" = "zhipu:glm-4.7"
     working_dir: Path = field(default_factory=Path.cwd)
     agents_md_path: Optional[Path] = None
     skills_path: Optional[Path] = None
-    thread_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    thread_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     excel_visible: bool = False
     excel_display_alerts: bool = False
     excel_interactive: bool = True
     tool_providers: list["ToolProvider"] = field(default_factory=list)
     streaming_enabled: bool = True
     logging: LoggingConfig = field(default_factory=LoggingConfig)
+    # SQLite file for conversation checkpoints; None keeps them in memory
+    checkpoint_path: Optional[Path] = None
 
     def __post_init__(self) -> None:
         if self.agents_md_path is None:
-            # __file__ is src-python/agent/config.py
-            # parent.parent.parent = project root
-            self.agents_md_path = Path(__file__).parent.parent.parent / "AGENTS.md"
+            self.agents_md_path = DEFAULT_AGENTS_MD_PATH
         if self.skills_path is None:
-            self.skills_path = Path(__file__).parent.parent.parent / "skills"
+            self.skills_path = DEFAULT_SKILLS_PATH
+
+    @cached_property
+    def resolved_working_dir(self) -> str:
+        return str(self.working_dir.resolve())
+
+    @cached_property
+    def memory_paths(self) -> Optional[list[str]]:
+        """Existing memory (AGENTS.md) paths, checked once per config."""
+        return _existing_paths(self.agents_md_path)
+
+    @cached_property
+    def skills_paths(self) -> Optional[list[str]]:
+        """Existing skills directories, checked once per config."""
+        return _existing_paths(self.skills_path)
 
-    def get_model_instance(self) -> BaseChatModel:
+    def get_model_instance(self) -> "BaseChatModel":
         from agent.model_provider import create_model
 
         return create_model(self.model)
@@ -1,6 +1,7 @@
 """Application context - centralized resource management."""
 
 import atexit
+import gc
 import logging
 import threading
 from typing import Optional, TYPE_CHECKING
@@ -58,8 +59,6 @@ class AppContext:
         self.initialize(config)
 
     def cleanup(self) -> None:
-        import gc
-
         for _ in range(2):
             gc.collect()
         if self._logger is not None:
@@ -1,11 +1,20 @@
 """Core agent interface - UI-agnostic business logic."""
 
+import hashlib
+import itertools
+import json
 import logging
-from collections.abc import AsyncGenerator
+import os
+import reprlib
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+import orjson
 
-from langgraph.graph.state import CompiledStateGraph
 from libs.stream_msg_parser import MessageParser
 from libs.stream_msg_parser.events import (
     ContentEvent as ParserContentEvent,
@@ -13,7 +22,6 @@ from libs.stream_msg_parser.events import (
     ToolCallArgsEvent as ParserToolCallArgsEvent,
     ToolCallStartEvent as ParserToolCallStartEvent,
     ToolCallEndEvent,
-    CompleteEvent,
     StreamEvent,
 )
 
@@ -31,16 +39,159 @@ from agent.events import (
     TodoUpdateEvent,
 )
 
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger("app.agent")
+
+_STATIC_SYSTEM_PROMPT = """## Data Source Schema
+
+This project may have pre-analyzed data source schemas available.
+- Call `read_datasource_schema()` (no args) to get a summary of all data sources before starting any data task.
+- Call `read_datasource_schema(source_name="filename.xlsx")` to get the full schema for a specific source.
+- Always check the schema before reading or writing data — it tells you sheet names, column names, and data types.
+"""
+
+_WORKING_DIR_PROMPT = """
+## Working Directory
+
+Your working directory is: `{working_dir}`
+
+Use absolute Windows paths under this directory when working with files.
+"""
+
+
+@lru_cache(maxsize=4)
+def _build_system_prompt(working_dir: str) -> str:
+    # Static guidance first, per-project details last, so the prompt
+    # prefix stays byte-identical across rebuilds and provider prompt
+    # caches keep hitting.
+    return _STATIC_SYSTEM_PROMPT + _WORKING_DIR_PROMPT.format(working_dir=working_dir)
+
+
+# Compiled graphs shared across AgentCore instances, LRU order
+_GRAPH_CACHE_SIZE = 4
+_graph_cache: OrderedDict[tuple, "CompiledStateGraph"] = OrderedDict()
+
+# Last seen content digest per memory file, to spot prefix drift between builds.
+_memory_digests: dict[str, str] = {}
+
+
+def _check_memory_drift(paths: list[str]) -> None:
+    """Warn when a memory file changed since the last agent build."""
+    for path in paths:
+        try:
+            digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            continue
+        previous = _memory_digests.get(path)
+        if previous is not None and previous != digest:
+            logger.warning("Memory file changed, prompt cache prefix reset: %s", path)
+        _memory_digests[path] = digest
+
+
+class _JsonScanner:
+    """Tracks bracket depth over streamed JSON to tell when the value is complete.
+
+    Single-quoted strings are skipped as well, so the scanner also reads
+    Python reprs of dicts and lists; in JSON a ``'`` only occurs inside
+    double-quoted strings, where it is ignored.
+    """
+
+    __slots__ = ("depth", "quote", "escape", "started")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.quote = ""  # quote char of the string being read, "" outside strings
+        self.escape = False
+        self.started = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume *chunk*; return True once the outermost value has closed."""
+        for ch in chunk:
+            if self.quote:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == self.quote:
+                    self.quote = ""
+            elif ch == '"' or ch == "'":
+                self.quote = ch
+            elif ch in "{[":
+                self.depth += 1
+                self.started = True
+            elif ch in "}]":
+                self.depth -= 1
+        return self.started and self.depth == 0
+
+
+def _value_end(text: str) -> int:
+    """Index of the bracket closing the value *text* starts with, or -1."""
+    scanner = _JsonScanner()
+    for i, ch in enumerate(text):
+        if scanner.feed(ch):
+            return i
+    return -1
+
+
+# Tool results forwarded to the UI are cut at this many characters
+_TOOL_RESULT_MAX_CHARS = 8000
+
+
+class _ToolResultRepr(reprlib.Repr):
+    """reprlib.Repr that keeps dict keys in insertion order instead of sorting."""
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        newlevel = level - 1
+        pieces = [
+            f"{self.repr1(key, newlevel)}: {self.repr1(x[key], newlevel)}"
+            for key in itertools.islice(x, self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+_TOOL_RESULT_REPR = _ToolResultRepr(
+    maxstring=_TOOL_RESULT_MAX_CHARS,
+    maxother=_TOOL_RESULT_MAX_CHARS,
+    maxlist=50,
+    maxdict=50,
+    maxlevel=4,
+)
+
+
+def _truncate_tool_result(text: str) -> str:
+    """Cut *text* to _TOOL_RESULT_MAX_CHARS, noting the original length."""
+    if len(text) <= _TOOL_RESULT_MAX_CHARS:
+        return text
+    return text[:_TOOL_RESULT_MAX_CHARS] + f" [truncated: {len(text)} total chars]"
+
+
+# Tool calls whose streamed args are held at once; dicts keep insertion
+# order, so the first key is the oldest call
+_TOOL_ARGS_BUFFER_MAX = 256
+
+# Leaked provider reasoning frames, e.g. "{'id': ..., 'type': 'reasoning'} text"
+_REASONING_PREFIXES = ("{'id':", '{"id":')
+
 
 class AgentCore:
     def __init__(self, config: Optional[AgentConfig] = None):
         self.config = config or AgentConfig()
-        self._agent: Optional[CompiledStateGraph] = None
+        self._agent: Optional["CompiledStateGraph"] = None
         self._parser = MessageParser(track_tool_lifecycle=True)
-        self._tool_args_buffer: dict[str, str] = {}
+        self._tool_args_buffer: dict[str, list[str]] = {}
         self._todo_args_cache: dict[str, str] = {}
+        self._todo_args_scan: dict[str, _JsonScanner] = {}
         self._logger: Optional[logging.Logger] = self._setup_logger()
         self._cancelled: bool = False
+        self._run_config: dict[str, Any] = {}
 
     def _setup_logger(self) -> Optional[logging.Logger]:
         if not self.config.logging.enabled:
@@ -55,16 +206,12 @@ class AgentCore:
         return setup_logging(self.config.logging)
 
     @property
-    def agent(self) -> CompiledStateGraph:
+    def agent(self) -> "CompiledStateGraph":
         if self._agent is None:
             self._agent = self._create_agent()
         return self._agent
 
-    def _create_agent(self) -> CompiledStateGraph:
-        from libs.deepagents import create_deep_agent
-        from libs.deepagents.backends import FilesystemBackend
-        from langgraph.checkpoint.memory import MemorySaver
-
+    def _create_agent(self) -> "CompiledStateGraph":
         tools = [t for p in self.config.tool_providers for t in p.get_tools()]
 
         # Inject schema tool if project root is set
@@ -73,31 +220,66 @@ class AgentCore:
 
             tools += SchemaToolProvider(self.config.working_dir).get_tools()
 
-        memory_paths = (
-            [str(self.config.agents_md_path)]
-            if self.config.agents_md_path and self.config.agents_md_path.exists()
-            else None
-        )
-        skills_paths = (
-            [str(self.config.skills_path)]
-            if self.config.skills_path and self.config.skills_path.exists()
-            else None
-        )
+        memory_paths = self.config.memory_paths
+        skills_paths = self.config.skills_paths
 
-        working_dir_str = str(self.config.working_dir.resolve())
-        system_prompt = f"""## Working Directory
+        # Reuse a graph compiled earlier for the same configuration (e.g. when
+        # switching back to a project); sessions are isolated by thread_id.
+        key = self._graph_key(tools, memory_paths, skills_paths)
+        if key is not None and key in _graph_cache:
+            _graph_cache.move_to_end(key)
+            return _graph_cache[key]
 
-Your working directory is: `{working_dir_str}`
+        graph = self._build_graph(tools, memory_paths, skills_paths)
+        if key is not None:
+            _graph_cache[key] = graph
+            if len(_graph_cache) > _GRAPH_CACHE_SIZE:
+                _graph_cache.popitem(last=False)
+        return graph
 
-Use absolute Windows paths under this directory when working with files.
+    def _graph_key(
+        self,
+        tools: list,
+        memory_paths: Optional[list[str]],
+        skills_paths: Optional[list[str]],
+    ) -> Optional[tuple]:
+        """Cache key for the compiled graph, or None if it cannot be shared."""
+        model = self.config.model
+        if not isinstance(model, str):
+            return None
+        from agent.model_provider import ModelProvider
+
+        # The API key is read from the environment when the model is built
+        provider_cfg = ModelProvider.from_string(model).config
+        api_key = os.environ.get(provider_cfg.api_key_env, "") if provider_cfg else ""
+        return (
+            model,
+            hashlib.sha256(api_key.encode()).hexdigest(),
+            tuple(t.name for t in tools),
+            tuple(memory_paths or ()),
+            tuple(skills_paths or ()),
+            self.config.resolved_working_dir,
+            str(self.config.checkpoint_path),
+            # The logging callback is baked into the compiled model
+            self._logger is not None,
+            self.config.logging.log_full_prompt,
+            self.config.logging.log_token_usage,
+            self.config.logging.log_timing,
+        )
 
-## Data Source Schema
+    def _build_graph(
+        self,
+        tools: list,
+        memory_paths: Optional[list[str]],
+        skills_paths: Optional[list[str]],
+    ) -> "CompiledStateGraph":
+        from libs.deepagents import create_deep_agent
+        from libs.deepagents.backends import FilesystemBackend
 
-This project may have pre-analyzed data source schemas available.
-- Call `read_datasource_schema()` (no args) to get a summary of all data sources before starting any data task.
-- Call `read_datasource_schema(source_name="filename.xlsx")` to get the full schema for a specific source.
-- Always check the schema before reading or writing data — it tells you sheet names, column names, and data types.
-"""
+        if memory_paths:
+            _check_memory_drift(memory_paths)
+
+        system_prompt = _build_system_prompt(self.config.resolved_working_dir)
         model = self.config.get_model_instance()
 
         if self._logger:
@@ -121,28 +303,54 @@ This project may have pre-analyzed data source schemas available.
             memory=memory_paths,
             skills=skills_paths,
             backend=FilesystemBackend(root_dir=self.config.working_dir),
-            checkpointer=MemorySaver(),
+            checkpointer=self._create_checkpointer(),
         )
 
+    def _create_checkpointer(self) -> Any:
+        """SQLite-backed checkpointer for projects, shared in-memory otherwise.
+
+        Must be called with the event loop running (AsyncSqliteSaver binds
+        to it); see get_sqlite_saver.
+        """
+        path = self.config.checkpoint_path
+        if path is None:
+            from agent.checkpoint import get_shared_memory_saver
+
+            return get_shared_memory_saver()
+
+        from agent.checkpoint import get_sqlite_saver
+
+        return get_sqlite_saver(path)
+
     async def astream_query(
         self,
         query: str,
         thread_id: Optional[str] = None,
     ) -> AsyncGenerator[AgentEvent, None]:
-
         self._cancelled = False
-        thread = thread_id or self.config.thread_id
+        # Calls left open by a cancelled or failed run never report an end
+        self._tool_args_buffer.clear()
+        self._todo_args_scan.clear()
+        self._todo_args_cache.clear()
+        run_config = self._get_run_config(thread_id or self.config.thread_id)
         yield QueryStartEvent(content=query)
         try:
             stream = self.agent.astream(
                 {"messages": [("user", query)]},
-                config={"configurable": {"thread_id": thread}},
+                config=run_config,
                 stream_mode="messages",
             )
             async for parser_event in self._parser.aparse(stream):  # type: ignore[arg-type]
                 if self._cancelled:
                     yield QueryEndEvent()
                     return
+                # Content tokens are the bulk of the stream: skip the handler
+                # lookup and list building of _convert_event for them
+                if type(parser_event) is ParserContentEvent:
+                    event = self._content_event(parser_event)
+                    if event is not None:
+                        yield event
+                    continue
                 for event in self._convert_event(parser_event):
                     yield event
             yield QueryEndEvent()
@@ -151,6 +359,22 @@ This project may have pre-analyzed data source schemas available.
                 self._logger.exception("astream_query error")
             yield ErrorEvent(error_message=str(e))
 
+    def _get_run_config(self, thread: str) -> dict[str, Any]:
+        """Return the run config for *thread*, rebuilt only when it changes."""
+        if self._run_config.get("configurable", {}).get("thread_id") != thread:
+            self._run_config = {"configurable": {"thread_id": thread}}
+        return self._run_config
+
+    def get_tool_args(self, tool_id: str) -> str:
+        """Return the argument JSON streamed so far for *tool_id*."""
+        return "".join(self._tool_args_buffer.get(tool_id, ()))
+
+    def _drop_tool_args(self, tool_id: str) -> None:
+        """Forget everything buffered for *tool_id*, including write_todos state."""
+        self._tool_args_buffer.pop(tool_id, None)
+        self._todo_args_scan.pop(tool_id, None)
+        self._todo_args_cache.pop(tool_id, None)
+
     def cancel(self) -> None:
         """Signal the running stream to stop after the current event."""
         self._cancelled = True
@@ -159,166 +383,166 @@ This project may have pre-analyzed data source schemas available.
         if not args_text:
             return None
         try:
-            import json as json_mod
-
-            parsed = json_mod.loads(args_text)
+            parsed = json.loads(args_text)
         except Exception as e:
             if self._logger:
                 self._logger.debug("Failed to parse todos args: %s", e)
             return None
-        if isinstance(parsed, dict):
+        if type(parsed) is dict:
             todos = parsed.get("todos")
-            if isinstance(todos, list):
+            if type(todos) is list:
                 return todos
         return None
 
+    def _content_event(self, parser_event: ParserContentEvent) -> Optional[AgentEvent]:
+        content = parser_event.content
+        if not content:
+            return None
+        if content[0] == "{":
+            # Stringified provider dicts leaking into content
+            if content.startswith(_REASONING_PREFIXES):
+                # Match the frame's own closing brace: summaries nest dicts
+                end = _value_end(content)
+                head = content[:end] if end != -1 else ""
+                if "'type': 'reasoning'" in head or '"type": "reasoning"' in head:
+                    # Keep only the text after the leaked reasoning frame
+                    content = content[end + 1 :].lstrip()
+                    if not content:
+                        return None
+            elif content.startswith("{'arguments':"):
+                return None
+        if parser_event.node == "thinking":
+            return ThinkingEvent(content=content)
+        return TextEvent(content=content)
+
     def _convert_event(self, parser_event: StreamEvent) -> list[AgentEvent]:
-        events: list[AgentEvent] = []
+        # Parser events are leaf dataclasses, so an exact-type lookup suffices
+        handler = _PARSER_EVENT_HANDLERS.get(type(parser_event))
+        return handler(self, parser_event) if handler is not None else []
+
+    def _on_content(self, parser_event: ParserContentEvent) -> list[AgentEvent]:
+        event = self._content_event(parser_event)
+        return [event] if event is not None else []
+
+    def _on_tool_start(self, parser_event: ParserToolCallStartEvent) -> list[AgentEvent]:
+        tool_args = ""
+        # The parsed dict rides along in data so consumers need not
+        # json.loads the string form back
+        data: Optional[dict[str, Any]] = None
+        if parser_event.args and type(parser_event.args) is dict:
+            try:
+                tool_args = orjson.dumps(parser_event.args).decode()
+                data = {"args": parser_event.args}
+            except Exception as e:
+                if self._logger:
+                    self._logger.debug("Failed to serialize tool args: %s", e)
+                tool_args = ""
+        events: list[AgentEvent] = [
+            ToolCallStartEvent(
+                tool_name=parser_event.name,
+                tool_args=tool_args,
+                tool_call_id=parser_event.id or None,
+                data=data,
+            )
+        ]
+        if parser_event.name == "write_todos" and type(parser_event.args) is dict:
+            todos = parser_event.args.get("todos")
+            if type(todos) is list:
+                events.append(TodoUpdateEvent(todos=todos))
+        return events
 
-        if isinstance(parser_event, ParserContentEvent):
-            content = parser_event.content
-            if isinstance(content, str) and content.startswith("{'id':"):
-                import re
-
-                if "'type': 'reasoning'" in content or '"type": "reasoning"' in content:
-                    match = re.match(r"^\{[^}]*\}\s*(.*)$", content)
-                    if match:
-                        extracted = match.group(1)
-                        if extracted and extracted.strip():
-                            content = extracted
-                        else:
-                            return events
-                    else:
-                        return events
-            if isinstance(content, str) and content.startswith("{'arguments':"):
-                return events
-            if not content:
-                return events
-            if hasattr(parser_event, "node") and parser_event.node == "thinking":
-                events.append(ThinkingEvent(content=content))
-            else:
-                events.append(TextEvent(content=content))
-            return events
-
-        elif isinstance(parser_event, ParserToolCallStartEvent):
-            import json as json_mod
-
-            tool_args = ""
-            if (
-                parser_event.args
-                and isinstance(parser_event.args, dict)
-                and len(parser_event.args) > 0
-            ):
-                try:
-                    tool_args = json_mod.dumps(parser_event.args)
-                except Exception as e:
-                    if self._logger:
-                        self._logger.debug("Failed to serialize tool args: %s", e)
-                    tool_args = ""
-            events.append(
-                ToolCallStartEvent(
-                    tool_name=parser_event.name,
-                    tool_args=tool_args,
-                    tool_call_id=getattr(parser_event, "id", None),
-                )
+    def _on_tool_args(self, parser_event: ParserToolCallArgsEvent) -> list[AgentEvent]:
+        events: list[AgentEvent] = []
+        tool_id = parser_event.id
+        if tool_id:
+            buf = self._tool_args_buffer.get(tool_id)
+            if buf is None:
+                # Calls that never report an end (cancelled runs) would
+                # otherwise pin their args forever
+                if len(self._tool_args_buffer) >= _TOOL_ARGS_BUFFER_MAX:
+                    self._drop_tool_args(next(iter(self._tool_args_buffer)))
+                buf = self._tool_args_buffer[tool_id] = []
+            buf.append(parser_event.args)
+        events.append(
+            ToolCallArgsEvent(
+                tool_name=parser_event.name,
+                content=parser_event.args,
+                tool_call_id=parser_event.id or None,
             )
-            if parser_event.name == "write_todos" and isinstance(
-                parser_event.args, dict
-            ):
-                todos = parser_event.args.get("todos")
-                if isinstance(todos, list):
+        )
+        if parser_event.name == "write_todos":
+            buffer_key = tool_id or f"name:{parser_event.name}"
+            if tool_id:
+                # Only parse once the streamed JSON closes its outer object
+                scanner = self._todo_args_scan.setdefault(tool_id, _JsonScanner())
+                complete = scanner.feed(parser_event.args or "")
+                combined_args = self.get_tool_args(tool_id) if complete else ""
+            else:
+                combined_args = parser_event.args or ""
+            todos = self._extract_todos_from_args(combined_args)
+            if todos is not None:
+                todos_key = json.dumps(todos, sort_keys=True)
+                if self._todo_args_cache.get(buffer_key) != todos_key:
+                    self._todo_args_cache[buffer_key] = todos_key
                     events.append(TodoUpdateEvent(todos=todos))
-            return events
+        return events
 
-        elif isinstance(parser_event, ParserToolCallArgsEvent):
-            existing_args = getattr(self, "_tool_args_buffer", {})
-            tool_id = parser_event.id
-            if tool_id:
-                existing_args[tool_id] = (
-                    existing_args.get(tool_id, "") + parser_event.args
-                )
-                self._tool_args_buffer = existing_args
-            events.append(
-                ToolCallArgsEvent(
-                    tool_name=parser_event.name,
-                    content=parser_event.args,
-                    tool_call_id=getattr(parser_event, "id", None),
-                )
-            )
-            if parser_event.name == "write_todos":
-                buffer_key = tool_id or f"name:{parser_event.name}"
-                combined_args = (
-                    existing_args.get(tool_id, "")
-                    if tool_id
-                    else (parser_event.args or "")
-                )
-                todos = self._extract_todos_from_args(combined_args)
-                if todos is not None:
-                    import json as json_mod_inner
-
-                    todos_key = json_mod_inner.dumps(todos, sort_keys=True)
-                    if self._todo_args_cache.get(buffer_key) != todos_key:
-                        self._todo_args_cache[buffer_key] = todos_key
-                        events.append(TodoUpdateEvent(todos=todos))
-            return events
-
-        elif isinstance(parser_event, ToolCallEndEvent):
-            content = ""
-            if parser_event.status == "error":
-                content = parser_event.error_message or "Tool call failed"
+    def _on_tool_end(self, parser_event: ToolCallEndEvent) -> list[AgentEvent]:
+        content = ""
+        if parser_event.status == "error":
+            content = parser_event.error_message or "Tool call failed"
+        elif parser_event.result:
+            result = parser_event.result
+            if type(result) is str:
+                content = _truncate_tool_result(result)
             else:
-                if parser_event.result:
-                    result_str = str(parser_event.result)
-                    if len(result_str) > 8000:
-                        content = (
-                            result_str[:8000]
-                            + f" [truncated: {len(result_str)} total chars]"
-                        )
-                    else:
-                        content = result_str
-                else:
-                    content = ""
-            events.append(
-                ToolResultEvent(
-                    tool_name=parser_event.name,
-                    content=content,
-                    tool_call_id=getattr(parser_event, "id", None),
-                    data={
-                        "status": parser_event.status,
-                        "duration_ms": parser_event.duration_ms,
-                    },
-                )
+                # Content-block lists and other objects: a depth-bounded repr
+                # instead of str() of the whole structure; nested strings
+                # can still add up, so the total is cut like a plain result
+                content = _truncate_tool_result(_TOOL_RESULT_REPR.repr(result))
+        tool_id = parser_event.id or None
+        # The call is over: release its buffered args and hand them to
+        # consumers on the result event
+        combined_args = (
+            "".join(self._tool_args_buffer.pop(tool_id, ())) if tool_id else ""
+        )
+        events: list[AgentEvent] = [
+            ToolResultEvent(
+                tool_name=parser_event.name,
+                content=content,
+                tool_call_id=tool_id,
+                data={
+                    "status": parser_event.status,
+                    "duration_ms": parser_event.duration_ms,
+                    "args": combined_args,
+                },
             )
-            if parser_event.name == "write_todos":
-                tool_id = getattr(parser_event, "id", None)
-                buffer_key = tool_id or f"name:{parser_event.name}"
-                combined_args = (
-                    self._tool_args_buffer.get(tool_id, "") if tool_id else ""
-                )
-                todos = self._extract_todos_from_args(combined_args)
-                if todos is not None:
-                    import json as json_mod_inner
-
-                    todos_key = json_mod_inner.dumps(todos, sort_keys=True)
-                    if self._todo_args_cache.get(buffer_key) != todos_key:
-                        self._todo_args_cache[buffer_key] = todos_key
-                        events.append(TodoUpdateEvent(todos=todos))
-                if tool_id:
-                    self._tool_args_buffer.pop(tool_id, None)
-                self._todo_args_cache.pop(buffer_key, None)
-            return events
-
-        elif isinstance(parser_event, ParserErrorEvent):
-            events.append(ErrorEvent(error_message=parser_event.error))
-            return events
-
-        elif isinstance(parser_event, CompleteEvent):
-            return events
-
+        ]
+        if parser_event.name == "write_todos":
+            buffer_key = tool_id or f"name:{parser_event.name}"
+            todos = self._extract_todos_from_args(combined_args)
+            if todos is not None:
+                todos_key = json.dumps(todos, sort_keys=True)
+                if self._todo_args_cache.get(buffer_key) != todos_key:
+                    self._todo_args_cache[buffer_key] = todos_key
+                    events.append(TodoUpdateEvent(todos=todos))
+            self._todo_args_cache.pop(buffer_key, None)
+            self._todo_args_scan.pop(buffer_key, None)
         return events
 
-    def new_session(self, thread_id: Optional[str] = None) -> str:
-        import uuid
+    def _on_parser_error(self, parser_event: ParserErrorEvent) -> list[AgentEvent]:
+        return [ErrorEvent(error_message=parser_event.error)]
 
-        self.config.thread_id = thread_id or str(uuid.uuid4())
+    def new_session(self, thread_id: Optional[str] = None) -> str:
+        self.config.thread_id = thread_id or uuid.uuid4().hex
         return self.config.thread_id
+
+
+# CompleteEvent has no entry: it maps to no agent events
+_PARSER_EVENT_HANDLERS: dict[type, Callable[[AgentCore, Any], list[AgentEvent]]] = {
+    ParserContentEvent: AgentCore._on_content,
+    ParserToolCallStartEvent: AgentCore._on_tool_start,
+    ParserToolCallArgsEvent: AgentCore._on_tool_args,
+    ToolCallEndEvent: AgentCore._on_tool_end,
+    ParserErrorEvent: AgentCore._on_parser_error,
+}
@@ -1,5 +1,6 @@
 """Event types for streaming agent output."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -44,11 +45,13 @@ class EventType(Enum):
     TODO_UPDATE = "todo_update"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     type: EventType
-    timestamp: datetime = field(default_factory=datetime.now)
-    data: dict[str, Any] = field(default_factory=dict)
+    # Wall-clock ns; a datetime is only built when timestamp is read
+    _ts_ns: int = field(default_factory=time.time_ns, init=False, repr=False)
+    # None unless set: most events (every text/thinking token) carry no data
+    data: Optional[dict[str, Any]] = None
     content: Optional[str] = None
     tool_name: Optional[str] = None
     tool_args: Optional[str] = None
@@ -56,6 +59,10 @@ class AgentEvent:
     error_message: Optional[str] = None
     todos: Optional[list[dict]] = None
 
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self._ts_ns / 1e9)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "type": self.type.value,
@@ -65,43 +72,43 @@ class AgentEvent:
             "tool_args": self.tool_args,
             "tool_call_id": self.tool_call_id,
             "error_message": self.error_message,
-            "data": self.data,
+            "data": self.data or {},
             "todos": self.todos,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingEvent(AgentEvent):
     type: EventType = EventType.THINKING
     content: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class TextEvent(AgentEvent):
     type: EventType = EventType.TEXT
     content: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class RefusalEvent(AgentEvent):
     type: EventType = EventType.REFUSAL
     content: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallStartEvent(AgentEvent):
     type: EventType = EventType.TOOL_CALL_START
     tool_name: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallArgsEvent(AgentEvent):
     type: EventType = EventType.TOOL_CALL_ARGS
     tool_name: str = ""  # type: ignore[assignment]
     content: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultEvent(AgentEvent):
     type: EventType = EventType.TOOL_RESULT
     tool_name: str = ""  # type: ignore[assignment]
@@ -109,24 +116,24 @@ class ToolResultEvent(AgentEvent):
     data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent(AgentEvent):
     type: EventType = EventType.ERROR
     error_message: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryStartEvent(AgentEvent):
     type: EventType = EventType.QUERY_START
     content: str = ""  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryEndEvent(AgentEvent):
     type: EventType = EventType.QUERY_END
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoUpdateEvent(AgentEvent):
     type: EventType = EventType.TODO_UPDATE
     todos: list[dict] = field(default_factory=list)  # type: ignore[assignment]
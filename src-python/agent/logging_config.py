@@ -1,10 +1,14 @@
 """Logging configuration module for LLM call logging."""
 
+import atexit
 import logging
 import sys
+import time
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
+from typing import Optional
 
 from agent.config import LoggingConfig
 
@@ -19,14 +23,96 @@ _APP_LOGGERS = [
     "app.project",
 ]
 _app_logging_initialized = False
+_listener: Optional[QueueListener] = None
+
+
+class _ThrottledFileHandler(TimedRotatingFileHandler):
+    """Rotating file handler that flushes at most every FLUSH_INTERVAL seconds.
+
+    StreamHandler flushes after every record, which during streaming means a
+    write syscall per logged token batch. Records are still written in order;
+    WARNING and above are flushed immediately, _IdleFlushQueueListener flushes
+    once its queue runs dry, and close() flushes the rest.
+    """
+
+    FLUSH_INTERVAL = 0.5
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_flush = 0.0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self._flush_now()
+
+    def flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self._flush_now()
+
+    def _flush_now(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+class _IdleFlushQueueListener(QueueListener):
+    """QueueListener that flushes throttled handlers when its queue is empty.
+
+    The throttled flush only runs when a record arrives, so without this the
+    tail of a burst stays buffered until the next record is logged.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, _ThrottledFileHandler):
+                    handler._flush_now()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs localtime/strftime at most once per second.
+
+    Bursts of records share the same second, and %(msecs)03d is appended by
+    the format string, so only the seconds part needs formatting.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+_LOG_FORMAT = "%(asctime)s.%(msecs)03d | %(name)-20s | %(levelname)-8s | %(message)s"
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The stock prepare() formats each record on the calling thread; the
+    records never leave the process, so formatting is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 def setup_app_logging(log_dir: Path | None = None) -> None:
     """Initialize all app loggers with a daily-rotating file handler.
 
+    Loggers only enqueue records; a QueueListener thread formats and writes
+    them, so the streaming coroutine never blocks on file I/O.
     Safe to call multiple times — subsequent calls are no-ops.
     """
-    global _app_logging_initialized
+    global _app_logging_initialized, _listener
     if _app_logging_initialized:
         return
     _app_logging_initialized = True
@@ -39,12 +125,9 @@ def setup_app_logging(log_dir: Path | None = None) -> None:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"app_{timestamp}.log"
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(name)-20s | %(levelname)-8s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = _CachedTimeFormatter(fmt=_LOG_FORMAT, datefmt=_LOG_DATEFMT)
 
-    file_handler = TimedRotatingFileHandler(
+    file_handler = _ThrottledFileHandler(
         log_file,
         when="midnight",
         backupCount=7,
@@ -53,12 +136,27 @@ def setup_app_logging(log_dir: Path | None = None) -> None:
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
 
+    queue: SimpleQueue = SimpleQueue()
+    queue_handler = _LocalQueueHandler(queue)
+    _listener = _IdleFlushQueueListener(queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    # Runs before logging's own atexit shutdown, which then flushes the file
+    atexit.register(shutdown_app_logging)
+
     for name in _APP_LOGGERS:
         lg = logging.getLogger(name)
         lg.setLevel(logging.DEBUG)
         lg.propagate = False
         if not lg.handlers:
-            lg.addHandler(file_handler)
+            lg.addHandler(queue_handler)
+
+
+def shutdown_app_logging() -> None:
+    """Stop the logging listener after it has written every queued record."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(config: LoggingConfig) -> logging.Logger:
@@ -78,10 +176,7 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     tools_logger.propagate = False
 
     if config.output in ("console", "both"):
-        formatter = logging.Formatter(
-            fmt="%(asctime)s | %(name)-20s | %(levelname)-8s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        formatter = _CachedTimeFormatter(fmt=_LOG_FORMAT, datefmt=_LOG_DATEFMT)
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
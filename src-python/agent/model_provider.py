@@ -1,11 +1,14 @@
 """Model provider configuration for Excel Agent."""
 
+import hashlib
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
 
-from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
 
 @dataclass
@@ -49,6 +52,21 @@ PREDEFINED_PROVIDERS: dict[str, ProviderConfig] = {
 }
 
 
+# Built chat models keyed by everything that goes into their constructor; the
+# API key is stored as a digest. Keys come from the environment at call time,
+# so a changed key builds a new model instead of returning a stale one.
+_MODEL_CACHE_SIZE = 8
+_model_cache: OrderedDict[tuple, "BaseChatModel"] = OrderedDict()
+
+
+@lru_cache(maxsize=128)
+def _split_model_string(model_string: str) -> tuple[str, str]:
+    if ":" in model_string:
+        provider_name, model_name = model_string.split(":", 1)
+        return provider_name, model_name
+    return "openai", model_string
+
+
 @dataclass
 class ModelProvider:
     provider: str
@@ -59,12 +77,7 @@ class ModelProvider:
 
     @classmethod
     def from_string(cls, model_string: str) -> "ModelProvider":
-        if ":" in model_string:
-            provider_name, model_name = model_string.split(":", 1)
-        else:
-            provider_name = "openai"
-            model_name = model_string
-
+        provider_name, model_name = _split_model_string(model_string)
         config = PREDEFINED_PROVIDERS.get(provider_name)
         if config is None:
             config = cls._create_custom_provider_config(provider_name)
@@ -106,7 +119,7 @@ class ModelProvider:
             extra_params={"temperature": 0.7},
         )
 
-    def create_model(self) -> BaseChatModel:
+    def create_model(self) -> "BaseChatModel":
         if self.config is None:
             raise ValueError(f"Unknown provider: {self.provider}")
 
@@ -118,6 +131,19 @@ class ModelProvider:
 
         base_url = self.explicit_base_url or self.config.api_base
 
+        key = (
+            self.model_name,
+            hashlib.sha256(api_key.encode()).hexdigest(),
+            base_url,
+            tuple(sorted(self.config.extra_params.items())),
+        )
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache.move_to_end(key)
+            return model
+
+        from langchain_openai import ChatOpenAI
+
         params: dict[str, Any] = {
             "model": self.model_name,
             "openai_api_key": api_key,
@@ -127,14 +153,18 @@ class ModelProvider:
         if base_url:
             params["openai_api_base"] = base_url
 
-        return ChatOpenAI(**params)
+        model = ChatOpenAI(**params)
+        _model_cache[key] = model
+        if len(_model_cache) > _MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+        return model
 
     def __str__(self) -> str:
         return f"{self.provider}:{self.model_name}"
 
 
-def create_model(model_spec: str | BaseChatModel) -> BaseChatModel:
-    if isinstance(model_spec, BaseChatModel):
+def create_model(model_spec: "str | BaseChatModel") -> "BaseChatModel":
+    if not isinstance(model_spec, str):
         return model_spec
     provider = ModelProvider.from_string(model_spec)
     return provider.create_model()
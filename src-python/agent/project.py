@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
@@ -14,9 +15,10 @@ PROJECT_DIR_NAME = ".excel-agent"
 PROJECT_CONFIG_NAME = "project.json"
 AGENT_MD_NAME = "Agent.md"
 SKILLS_DIR_NAME = "skills"
+CHECKPOINT_DB_NAME = "checkpoints.sqlite"
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSource:
     id: str
     type: str  # "excel" | "csv"
@@ -24,14 +26,14 @@ class DataSource:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectOptions:
     data_cleaning_enabled: bool = True
     auto_save_memory: bool = True
     show_hidden_files: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     name: str
     created_at: str
@@ -43,14 +45,14 @@ class ProjectConfig:
     data_sources_hash: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentProject:
     path: str
     name: str
     last_opened: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalConfig:
     recent_projects: list[RecentProject] = field(default_factory=list)
 
@@ -59,7 +61,6 @@ class GlobalConfig:
 
 
 def compute_data_sources_hash(data_sources: list[DataSource]) -> str:
-    import hashlib
     paths = sorted(s.path for s in data_sources)
     return hashlib.sha256("|".join(paths).encode()).hexdigest()[:16]
 
@@ -181,3 +182,8 @@ def get_project_agent_paths(project_root: Path) -> tuple[Path, Path]:
     """Returns (agent_md_path, skills_path)."""
     proj_dir = _project_dir(project_root)
     return proj_dir / AGENT_MD_NAME, proj_dir / SKILLS_DIR_NAME
+
+
+def get_project_checkpoint_path(project_root: Path) -> Path:
+    """Returns the SQLite file holding the project's conversation checkpoints."""
+    return _project_dir(project_root) / CHECKPOINT_DB_NAME
@@ -19,6 +19,8 @@ class ErrorCode(str, Enum):
 
 
 class AppError(Exception):
+    __slots__ = ("code", "message", "status")
+
     def __init__(self, code: ErrorCode, message: str, status: int = 400) -> None:
         super().__init__(message)
         self.code = code
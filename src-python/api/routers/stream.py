@@ -1,15 +1,19 @@
 """Stream endpoints: POST /api/stream, POST /api/stream/cancel"""
 
 import asyncio
-import json
 import logging
+import time
 import uuid
-from typing import Optional
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any, Final, Optional
 
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from agent.events import AgentEvent, EventType, ThinkingEvent
 from api.deps import get_core, get_project_service, verify_token
 from services.project_service import ProjectService
 
@@ -18,6 +22,212 @@ stream_logger = logging.getLogger("app.stream")
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
+# Consecutive text/thinking tokens are coalesced into a single SSE frame and
+# flushed at most every _TOKEN_FLUSH_INTERVAL seconds (or once the pending
+# payload reaches _TOKEN_FLUSH_CHARS), instead of one frame per token.
+_TOKEN_FLUSH_INTERVAL = 0.03
+_TOKEN_FLUSH_CHARS = 4096
+
+# Events buffered between the agent stream and the SSE writer
+_EVENT_QUEUE_SIZE = 64
+_EOS = object()
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse(payload: dict) -> bytes:
+    # orjson emits UTF-8 bytes directly, which StreamingResponse sends as-is
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+# Static frame sent at the end of every successful turn
+_DONE_FRAME: Final = _sse({"type": "stream:done"})
+
+
+def _close_workbooks_sync() -> None:
+    try:
+        from libs.excel_com import ExcelInstanceManager
+        from libs.excel_com.com_thread import run_on_com_thread
+
+        run_on_com_thread(ExcelInstanceManager().close_agent_workbooks)
+    except Exception as e:
+        logger.warning("close_agent_workbooks failed: %s", e)
+
+
+@dataclass(slots=True)
+class _StreamState:
+    """Per-request token coalescing and log buffering for one SSE stream."""
+
+    # Pending (not yet sent) token frame: SSE type + accumulated tokens
+    pending_type: Optional[str] = None
+    pending: list[str] = field(default_factory=list)
+    pending_chars: int = 0
+    last_flush: float = 0.0
+    # Tokens of the current text/thinking run, logged as one line
+    log_type: Optional[str] = None
+    log_buf: list[str] = field(default_factory=list)
+    # Checked once per request so disabled token logging costs nothing per token
+    log_tokens: bool = field(
+        default_factory=lambda: stream_logger.isEnabledFor(logging.INFO)
+    )
+
+    def drain(self) -> bytes:
+        """Return the pending token frame (b"" if none) and reset it."""
+        if not self.pending:
+            return b""
+        frame = _sse({"type": self.pending_type, "token": "".join(self.pending)})
+        self.pending.clear()
+        self.pending_type = None
+        self.pending_chars = 0
+        self.last_flush = time.monotonic()
+        return frame
+
+    def push(self, sse_type: str, token: str) -> bytes:
+        """Queue a token; return the SSE frame(s) now due, if any."""
+        if self.log_tokens:
+            if self.log_type != sse_type:
+                self.flush_log()
+                self.log_type = sse_type
+            self.log_buf.append(token)
+
+        out = self.drain() if self.pending_type != sse_type else b""
+        self.pending_type = sse_type
+        self.pending.append(token)
+        self.pending_chars += len(token)
+        if (
+            self.pending_chars >= _TOKEN_FLUSH_CHARS
+            or time.monotonic() - self.last_flush >= _TOKEN_FLUSH_INTERVAL
+        ):
+            out += self.drain()
+        return out
+
+    def flush_log(self) -> None:
+        if self.log_buf:
+            stream_logger.info("<<< %s %r", self.log_type, "".join(self.log_buf))
+            self.log_buf.clear()
+        self.log_type = None
+
+
+def _on_text(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    return st.push("stream:text", event.content or "")
+
+
+def _on_thinking(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    return st.push("stream:thinking", event.content or "")
+
+
+def _on_tool_start(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    call_id = event.tool_call_id or uuid.uuid4().hex
+    args: dict = (event.data or {}).get("args") or {}
+    if not args and event.tool_args:
+        try:
+            args = orjson.loads(event.tool_args)
+        except Exception:
+            args = {}
+    stream_logger.info("<<< tool:start id=%s name=%s", call_id, event.tool_name)
+    return _sse({
+        "type": "tool:start",
+        "id": call_id,
+        "name": event.tool_name,
+        "args": args,
+    })
+
+
+def _on_tool_result(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    call_id = event.tool_call_id or ""
+    status = "error" if event.data.get("status") == "error" else "success"
+    duration_ms = event.data.get("duration_ms")
+    # Args streamed in chunks; the core joins them onto the result event
+    args_str = event.data.get("args") or ""
+    args_patch: dict = {}
+    if args_str:
+        try:
+            args_patch = orjson.loads(args_str)
+        except Exception:
+            args_patch = {}
+    stream_logger.info(
+        "<<< tool:result id=%s name=%s status=%s duration_ms=%s result=%r",
+        call_id, event.tool_name, status, duration_ms, event.content,
+    )
+    return _sse({
+        "type": "tool:result",
+        "id": call_id,
+        "name": event.tool_name,
+        "status": status,
+        "result": event.content,
+        "duration_ms": duration_ms,
+        "args": args_patch,
+    })
+
+
+def _on_todo_update(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    tasks = [
+        {
+            "id": t.get("id") or (
+                uuid.uuid5(uuid.NAMESPACE_OID, t.get("content", t.get("label", str(i)))).hex
+            ),
+            "label": t.get("content", t.get("label", "")),
+            "status": t.get("status", "pending"),
+        }
+        for i, t in enumerate(event.todos or [])
+    ]
+    stream_logger.info("<<< tasks:update count=%d", len(tasks))
+    return _sse({"type": "tasks:update", "tasks": tasks})
+
+
+def _on_query_end(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    stream_logger.info("<<< stream:done")
+    return _DONE_FRAME
+
+
+def _on_error(event: AgentEvent, st: _StreamState, core: Any) -> bytes:
+    stream_logger.error("<<< stream:done error=%r", event.error_message)
+    return _sse({"type": "stream:done", "error": event.error_message})
+
+
+_EVENT_HANDLERS: Final[dict[EventType, Callable[[AgentEvent, _StreamState, Any], bytes]]] = {
+    EventType.TEXT: _on_text,
+    EventType.THINKING: _on_thinking,
+    EventType.TOOL_CALL_START: _on_tool_start,
+    EventType.TOOL_RESULT: _on_tool_result,
+    EventType.TODO_UPDATE: _on_todo_update,
+    EventType.QUERY_END: _on_query_end,
+    EventType.ERROR: _on_error,
+}
+_TOKEN_EVENTS: Final = frozenset({EventType.TEXT, EventType.THINKING})
+_TERMINAL_EVENTS: Final = frozenset({EventType.QUERY_END, EventType.ERROR})
+
+
+async def _produce(events: AsyncIterator[AgentEvent], queue: asyncio.Queue) -> None:
+    """Pump agent events into *queue* so a slow client never stalls the model stream.
+
+    While the queue is full, consecutive thinking tokens are merged into one
+    pending event instead of waiting; every event's content is kept and
+    order is preserved. Ends with _EOS, or the raised exception.
+    """
+    thinking: list[str] = []
+    try:
+        async for event in events:
+            if event.type is EventType.THINKING:
+                thinking.append(event.content or "")
+                if queue.full():
+                    continue
+                if len(thinking) > 1:
+                    event = ThinkingEvent(content="".join(thinking))
+                thinking.clear()
+            elif thinking:
+                await queue.put(ThinkingEvent(content="".join(thinking)))
+                thinking.clear()
+            await queue.put(event)
+    except Exception as exc:
+        if thinking:
+            await queue.put(ThinkingEvent(content="".join(thinking)))
+        await queue.put(exc)
+        return
+    if thinking:
+        await queue.put(ThinkingEvent(content="".join(thinking)))
+    await queue.put(_EOS)
+
 
 class StreamRequest(BaseModel):
     message: str
@@ -38,147 +248,67 @@ async def stream_endpoint(
     project_svc: ProjectService = Depends(get_project_service),
 ):
     async def generate():
-        from agent.events import (
-            ErrorEvent,
-            QueryEndEvent,
-            TextEvent,
-            ThinkingEvent,
-            TodoUpdateEvent,
-            ToolCallStartEvent,
-            ToolResultEvent,
-        )
-
-        def _sse(payload: dict) -> str:
-            return f"data: {json.dumps(payload)}\n\n"
-
         stream_logger.info(
             ">>> REQUEST thread_id=%s message=%r", req.thread_id, req.message
         )
-
-        _text_buf: list[str] = []
-        _thinking_buf: list[str] = []
-
-        def _flush_text():
-            if _text_buf:
-                stream_logger.info("<<< stream:text %r", "".join(_text_buf))
-                _text_buf.clear()
-
-        def _flush_thinking():
-            if _thinking_buf:
-                stream_logger.info("<<< stream:thinking %r", "".join(_thinking_buf))
-                _thinking_buf.clear()
-
-        def _close_workbooks_sync():
-            try:
-                from libs.excel_com import ExcelInstanceManager
-                from libs.excel_com.com_thread import run_on_com_thread
-
-                run_on_com_thread(ExcelInstanceManager().close_agent_workbooks)
-            except Exception as e:
-                logger.warning("close_agent_workbooks failed: %s", e)
+        st = _StreamState()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
 
         project_svc.mark_stream_start()
+        producer = asyncio.create_task(
+            _produce(core.astream_query(req.message, thread_id=req.thread_id), queue)
+        )
         try:
-            async for event in core.astream_query(req.message, thread_id=req.thread_id):
-                if isinstance(event, TextEvent):
-                    if _thinking_buf:
-                        _flush_thinking()
-                    _text_buf.append(event.content or "")
-                    yield _sse({"type": "stream:text", "token": event.content})
-
-                elif isinstance(event, ThinkingEvent):
-                    if _text_buf:
-                        _flush_text()
-                    _thinking_buf.append(event.content or "")
-                    yield _sse({"type": "stream:thinking", "token": event.content})
-
-                elif isinstance(event, ToolCallStartEvent):
-                    _flush_text()
-                    _flush_thinking()
-                    call_id = event.tool_call_id or str(uuid.uuid4())
-                    args: dict = {}
-                    if event.tool_args:
-                        try:
-                            args = json.loads(event.tool_args)
-                        except Exception:
-                            args = {}
-                    stream_logger.info("<<< tool:start id=%s name=%s", call_id, event.tool_name)
-                    yield _sse({
-                        "type": "tool:start",
-                        "id": call_id,
-                        "name": event.tool_name,
-                        "args": args,
-                    })
-
-                elif isinstance(event, ToolResultEvent):
-                    _flush_text()
-                    _flush_thinking()
-                    call_id = event.tool_call_id or ""
-                    status = "error" if event.data.get("status") == "error" else "success"
-                    duration_ms = event.data.get("duration_ms")
-                    # Recover accumulated args from the core buffer (args stream in chunks)
-                    args_str = core._tool_args_buffer.get(call_id, "") if call_id else ""
-                    args_patch: dict = {}
-                    if args_str:
-                        try:
-                            args_patch = json.loads(args_str)
-                        except Exception:
-                            args_patch = {}
-                    stream_logger.info(
-                        "<<< tool:result id=%s name=%s status=%s duration_ms=%s result=%r",
-                        call_id, event.tool_name, status, duration_ms, event.content,
-                    )
-                    yield _sse({
-                        "type": "tool:result",
-                        "id": call_id,
-                        "name": event.tool_name,
-                        "status": status,
-                        "result": event.content,
-                        "duration_ms": duration_ms,
-                        "args": args_patch,
-                    })
-
-                elif isinstance(event, TodoUpdateEvent):
-                    _flush_text()
-                    _flush_thinking()
-                    tasks = [
-                        {
-                            "id": t.get("id") or str(
-                                uuid.uuid5(uuid.NAMESPACE_OID, t.get("content", t.get("label", str(i))))
-                            ),
-                            "label": t.get("content", t.get("label", "")),
-                            "status": t.get("status", "pending"),
-                        }
-                        for i, t in enumerate(event.todos or [])
-                    ]
-                    stream_logger.info("<<< tasks:update count=%d", len(tasks))
-                    yield _sse({"type": "tasks:update", "tasks": tasks})
-
-                elif isinstance(event, QueryEndEvent):
-                    _flush_text()
-                    _flush_thinking()
-                    stream_logger.info("<<< stream:done")
-                    yield _sse({"type": "stream:done"})
-                    await asyncio.to_thread(_close_workbooks_sync)
+            while True:
+                if st.pending:
+                    # Send a held token frame once its interval is up, even
+                    # if no further token arrives to trigger push()
+                    remaining = _TOKEN_FLUSH_INTERVAL - (time.monotonic() - st.last_flush)
+                    try:
+                        event = await asyncio.wait_for(queue.get(), max(remaining, 0.0))
+                    except TimeoutError:
+                        yield st.drain()
+                        continue
+                else:
+                    event = await queue.get()
+                if event is _EOS:
+                    break
+                if isinstance(event, Exception):
+                    raise event
+                if event.type not in _TOKEN_EVENTS:
+                    # Any non-token event closes the pending token frame first
+                    st.flush_log()
+                    frame = st.drain()
+                    if frame:
+                        yield frame
 
-                elif isinstance(event, ErrorEvent):
-                    _flush_text()
-                    _flush_thinking()
-                    stream_logger.error("<<< stream:done error=%r", event.error_message)
-                    yield _sse({"type": "stream:done", "error": event.error_message})
+                handler = _EVENT_HANDLERS.get(event.type)
+                if handler is None:
+                    continue
+                frame = handler(event, st, core)
+                if frame:
+                    yield frame
+                if event.type in _TERMINAL_EVENTS:
                     await asyncio.to_thread(_close_workbooks_sync)
 
+            frame = st.drain()
+            if frame:
+                yield frame
+
         except Exception as exc:
-            _flush_text()
-            _flush_thinking()
+            st.flush_log()
             logger.exception("stream_endpoint unhandled error")
+            frame = st.drain()
+            if frame:
+                yield frame
             yield _sse({"type": "stream:done", "error": str(exc)})
             await asyncio.to_thread(_close_workbooks_sync)
         finally:
+            producer.cancel()
             project_svc.mark_stream_end()
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        headers=_SSE_HEADERS,
     )
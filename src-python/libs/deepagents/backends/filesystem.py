@@ -8,6 +8,8 @@ import json
 import os
 import re
 import subprocess
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -34,6 +36,11 @@ _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 _STARTUPINFO.wShowWindow = subprocess.SW_HIDE
 _CREATION_FLAGS = subprocess.CREATE_NO_WINDOW
 
+# Bounds for the per-backend caches of resolved relative paths and file text.
+# Every cached graph builds its own backend, so the text budget is kept small.
+_PATH_CACHE_SIZE = 256
+_TEXT_CACHE_MAX_CHARS = 4 * 1024 * 1024
+
 
 class FilesystemBackend(BackendProtocol):
     """Backend that reads and writes files directly from the filesystem.
@@ -62,6 +69,11 @@ class FilesystemBackend(BackendProtocol):
         """
         self.cwd = Path(root_dir).resolve() if root_dir else Path.cwd()
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self._path_cache: dict[str, Path] = {}
+        # path -> ((mtime_ns, size), text), LRU order, bounded by total chars
+        self._text_cache: OrderedDict[Path, tuple[tuple[int, int], str]] = OrderedDict()
+        self._text_cache_chars = 0
+        self._cache_lock = threading.Lock()
 
     def _resolve_path(self, key: str) -> Path:
         """Resolve a file path.
@@ -76,7 +88,43 @@ class FilesystemBackend(BackendProtocol):
         """
         if os.path.isabs(key):
             return Path(key)
-        return Path(os.path.normpath(os.path.join(str(self.cwd), key)))
+        path = self._path_cache.get(key)
+        if path is None:
+            path = Path(os.path.normpath(os.path.join(str(self.cwd), key)))
+            if len(self._path_cache) >= _PATH_CACHE_SIZE:
+                self._path_cache.clear()
+            self._path_cache[key] = path
+        return path
+
+    def _read_text(self, path: Path) -> str:
+        """Read *path* as UTF-8, reusing the cached text while mtime/size match."""
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            hit = self._text_cache.get(path)
+            if hit is not None and hit[0] == stamp:
+                self._text_cache.move_to_end(path)
+                return hit[1]
+
+        content = path.read_text(encoding="utf-8")
+        if len(content) > _TEXT_CACHE_MAX_CHARS // 4:
+            return content
+        with self._cache_lock:
+            old = self._text_cache.pop(path, None)
+            if old is not None:
+                self._text_cache_chars -= len(old[1])
+            self._text_cache[path] = (stamp, content)
+            self._text_cache_chars += len(content)
+            while self._text_cache_chars > _TEXT_CACHE_MAX_CHARS:
+                _, (_, evicted) = self._text_cache.popitem(last=False)
+                self._text_cache_chars -= len(evicted)
+        return content
+
+    def _invalidate(self, path: Path) -> None:
+        with self._cache_lock:
+            old = self._text_cache.pop(path, None)
+            if old is not None:
+                self._text_cache_chars -= len(old[1])
 
     def ls_info(self, path: str) -> list[FileInfo]:
         """List files and directories in the specified directory (non-recursive).
@@ -186,7 +234,7 @@ class FilesystemBackend(BackendProtocol):
                 return format_content_with_line_numbers(selected, start_line=offset + 1)
 
             # Default path: read entire file
-            content = resolved_path.read_text(encoding="utf-8")
+            content = self._read_text(resolved_path)
 
             empty_msg = check_empty_content(content)
             if empty_msg:
@@ -223,6 +271,7 @@ class FilesystemBackend(BackendProtocol):
         try:
             resolved_path.parent.mkdir(parents=True, exist_ok=True)
             resolved_path.write_text(content, encoding="utf-8")
+            self._invalidate(resolved_path)
             return WriteResult(path=file_path, files_update=None)
         except (OSError, UnicodeEncodeError) as e:
             return WriteResult(error=f"Error writing file '{file_path}': {e}")
@@ -254,7 +303,7 @@ class FilesystemBackend(BackendProtocol):
             return EditResult(error=f"Error: File '{file_path}' not found")
 
         try:
-            content = resolved_path.read_text(encoding="utf-8")
+            content = self._read_text(resolved_path)
 
             result = perform_string_replacement(
                 content, old_string, new_string, replace_all
@@ -265,6 +314,7 @@ class FilesystemBackend(BackendProtocol):
 
             new_content, occurrences = result
             resolved_path.write_text(new_content, encoding="utf-8")
+            self._invalidate(resolved_path)
 
             return EditResult(
                 path=file_path, files_update=None, occurrences=int(occurrences)
@@ -472,6 +522,7 @@ class FilesystemBackend(BackendProtocol):
                 resolved_path = self._resolve_path(path)
                 resolved_path.parent.mkdir(parents=True, exist_ok=True)
                 resolved_path.write_bytes(content)
+                self._invalidate(resolved_path)
 
                 responses.append(FileUploadResponse(path=path, error=None))
             except FileNotFoundError:
@@ -1,35 +1,60 @@
-"""Excel COM automation library."""
-
-from .com_thread import run_on_com_thread, shutdown_com_thread
-from .instance_manager import ExcelInstanceManager, WorkbookEntry
-from .errors import (
-    ExcelComError,
-    ExcelInstanceError,
-    WorkbookNotFoundError,
-    WorkbookReadOnlyError,
-    SheetNotFoundError,
-    RangeError,
-    FormulaError,
-    TableError,
-    QueryError,
-    ComCallError,
-    StaleReferenceError,
-)
-
-__all__ = [
-    "run_on_com_thread",
-    "shutdown_com_thread",
-    "ExcelInstanceManager",
-    "WorkbookEntry",
-    "ExcelComError",
-    "ExcelInstanceError",
-    "WorkbookNotFoundError",
-    "WorkbookReadOnlyError",
-    "SheetNotFoundError",
-    "RangeError",
-    "FormulaError",
-    "TableError",
-    "QueryError",
-    "ComCallError",
-    "StaleReferenceError",
-]
+"""Excel COM automation library.
+
+Exports are resolved lazily (PEP 562): importing one submodule, e.g.
+``libs.excel_com.com_thread`` at server startup, does not load
+win32com.client and the instance manager until they are first used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY_MAP: dict[str, str] = {
+    "arun_on_com_thread": ".com_thread",
+    "run_on_com_thread": ".com_thread",
+    "shutdown_com_thread": ".com_thread",
+    "ExcelInstanceManager": ".instance_manager",
+    "WorkbookEntry": ".instance_manager",
+    "ExcelComError": ".errors",
+    "ExcelInstanceError": ".errors",
+    "WorkbookNotFoundError": ".errors",
+    "WorkbookReadOnlyError": ".errors",
+    "SheetNotFoundError": ".errors",
+    "RangeError": ".errors",
+    "FormulaError": ".errors",
+    "TableError": ".errors",
+    "QueryError": ".errors",
+    "ComCallError": ".errors",
+    "StaleReferenceError": ".errors",
+}
+
+__all__ = list(_LAZY_MAP)
+
+if TYPE_CHECKING:
+    from .com_thread import arun_on_com_thread, run_on_com_thread, shutdown_com_thread
+    from .instance_manager import ExcelInstanceManager, WorkbookEntry
+    from .errors import (
+        ExcelComError,
+        ExcelInstanceError,
+        WorkbookNotFoundError,
+        WorkbookReadOnlyError,
+        SheetNotFoundError,
+        RangeError,
+        FormulaError,
+        TableError,
+        QueryError,
+        ComCallError,
+        StaleReferenceError,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -6,19 +6,45 @@ created on one thread become invalid on another.
 
 This module provides a single long-lived thread with CoInitialize() called once,
 and a `run_on_com_thread(fn, *args, **kwargs)` helper that marshals any callable
-onto that thread and returns the result.
+onto that thread and returns the result. `arun_on_com_thread` is the awaitable
+variant: it resolves an asyncio future instead of parking a worker thread, so
+concurrent tool calls from the agent's event loop don't each hold a thread
+while they wait their turn on the COM thread.
 """
 
+import asyncio
 import logging
 import queue
 import threading
 from typing import Any, Callable
 
-import pythoncom
-
 logger = logging.getLogger("app.excel")
 
-_REQUEST = tuple  # (callable, args, kwargs, result_queue)
+_REQUEST = tuple  # (callable, args, kwargs, result_sink)
+
+
+class _FutureSink:
+    """Queue-like result sink that resolves an asyncio future from the COM thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, fut: asyncio.Future) -> None:
+        self._loop = loop
+        self._fut = fut
+
+    def put(self, item: tuple[bool, Any]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._resolve, item)
+        except RuntimeError:
+            # Loop closed while the call ran: nobody is waiting for the result
+            logger.debug("Dropping COM result for closed event loop")
+
+    def _resolve(self, item: tuple[bool, Any]) -> None:
+        if self._fut.done():  # caller timed out / was cancelled
+            return
+        ok, value = item
+        if ok:
+            self._fut.set_result(value)
+        else:
+            self._fut.set_exception(value)
 
 
 class _ComThread(threading.Thread):
@@ -30,6 +56,10 @@ class _ComThread(threading.Thread):
         self._ready = threading.Event()
 
     def run(self) -> None:
+        # Imported here so server startup (which only needs shutdown_com_thread)
+        # does not load pywin32 until the first Excel call starts the thread.
+        import pythoncom
+
         pythoncom.CoInitialize()
         logger.info("COM thread started (thread=%s)", threading.current_thread().ident)
         self._ready.set()
@@ -60,6 +90,18 @@ class _ComThread(threading.Thread):
             return value
         raise value
 
+    async def asubmit(
+        self, fn: Callable, *args: Any, timeout: float = 30.0, **kwargs: Any
+    ) -> Any:
+        """Run *fn* on the COM thread and await its result without blocking."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self._queue.put((fn, args, kwargs, _FutureSink(loop, fut)))
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Excel COM call timed out after {timeout}s")
+
     def shutdown(self) -> None:
         self._queue.put(None)
 
@@ -93,6 +135,20 @@ def run_on_com_thread(fn: Callable, *args: Any, timeout: float = 30.0, **kwargs:
     return t.submit(fn, *args, timeout=timeout, **kwargs)
 
 
+async def arun_on_com_thread(
+    fn: Callable, *args: Any, timeout: float = 30.0, **kwargs: Any
+) -> Any:
+    """Awaitable variant of `run_on_com_thread`.
+
+    Calls are still executed one at a time on the COM thread; only the
+    waiting side is asynchronous.
+    """
+    t = _thread
+    if t is None or not t.is_alive():
+        t = await asyncio.to_thread(_ensure_thread)
+    return await t.asubmit(fn, *args, timeout=timeout, **kwargs)
+
+
 def shutdown_com_thread() -> None:
     """Shut down the COM thread (call on app exit)."""
     global _thread
@@ -57,4 +57,4 @@ HRESULT_MAP: dict[int, str] = {
 }
 
 # Transient COM errors that are safe to retry
-TRANSIENT_HRESULTS = {-2147418111, -2147417848}
+TRANSIENT_HRESULTS: frozenset[int] = frozenset({-2147418111, -2147417848})
@@ -4,6 +4,10 @@
 class ExcelComError(Exception):
     """Base exception for all Excel COM errors."""
 
+    # Slots keep the lazily-created instance __dict__ from ever being built;
+    # subclasses add no attributes, so they need no slots of their own.
+    __slots__ = ("user_message", "raw_error")
+
     def __init__(self, user_message: str, raw_error: Exception | None = None):
         self.user_message = user_message
         self.raw_error = raw_error
@@ -30,10 +30,21 @@ def get_formula(sheet: Any, range_address: str) -> list[list[str]]:
 @com_retry(max_retries=2, delay=0.5)
 def set_formula(sheet: Any, range_address: str, formula: str) -> None:
     """Set a formula on a range."""
+    _write_formula(sheet, range_address, formula)
+    pump_messages()
+
+
+@com_retry(max_retries=2, delay=0.5)
+def set_formulas(sheet: Any, formulas: list[tuple[str, str]]) -> None:
+    """Set several (range_address, formula) pairs, pumping messages once."""
+    for range_address, formula in formulas:
+        _write_formula(sheet, range_address, formula)
+    pump_messages()
+
+
+def _write_formula(sheet: Any, range_address: str, formula: str) -> None:
     try:
-        rng = sheet.Range(range_address)
-        rng.Formula = formula
-        pump_messages()
+        sheet.Range(range_address).Formula = formula
     except Exception as e:
         err_msg = str(e)
         if "0x800a03ec" in err_msg.lower():
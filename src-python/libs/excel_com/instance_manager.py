@@ -24,31 +24,107 @@ from .utils import com_retry, normalize_path, pump_messages
 logger = logging.getLogger("app.excel")
 
 
-@dataclass
+# Early binding through makepy wrappers is opt-in (EXCEL_AGENT_EARLY_BIND=1)
+# until it has been validated against more Excel versions.
+_EARLY_BIND_ENABLED = os.environ.get("EXCEL_AGENT_EARLY_BIND") == "1"
+
+# Wrapper classes already resolved through gencache, keyed by
+# (typelib GUID, LCID, major, minor, interface IID)
+_early_bound_classes: dict[tuple, type] = {}
+# After a type library failure, early binding is skipped until this
+# monotonic time, then tried again
+_EARLY_BIND_RETRY_INTERVAL = 60.0
+_early_bind_retry_at = 0.0
+
+
+def _early_bind(obj: Any) -> Any:
+    """Wrap a late-bound COM object in its makepy (gencache) class.
+
+    Early-bound wrappers call through cached DISPIDs instead of resolving
+    every property/method name with GetIDsOfNames, and objects returned from
+    them (Workbooks, Range, ...) are early-bound too. Falls back to the
+    late-bound object if the type library wrapper cannot be generated.
+
+    The type library is only loaded on the first object of each interface
+    and type library version; later objects are wrapped with the cached
+    class directly. Returns *obj* unchanged unless EXCEL_AGENT_EARLY_BIND=1
+    is set.
+    """
+    global _early_bind_retry_at
+    if not _EARLY_BIND_ENABLED or time.monotonic() < _early_bind_retry_at:
+        return obj
+    try:
+        type_info = obj._oleobj_.GetTypeInfo()
+        iid = type_info.GetTypeAttr()[0]
+        type_lib = type_info.GetContainingTypeLib()[0]
+        guid, lcid, _, major, minor, _ = type_lib.GetLibAttr()
+        key = (str(guid), lcid, major, minor, str(iid))
+        cls = _early_bound_classes.get(key)
+        if cls is not None:
+            return cls(obj._oleobj_)
+        wrapped = win32com.client.gencache.EnsureDispatch(obj)
+        _early_bound_classes[key] = type(wrapped)
+        return wrapped
+    except (ImportError, OSError, COMError) as e:
+        # gen_py unwritable/corrupt or no type library: later wraps would
+        # likely fail the same way, so back off before trying again
+        logger.warning(
+            "Early binding unavailable, using late binding for %.0fs: %s",
+            _EARLY_BIND_RETRY_INTERVAL, e,
+        )
+        _early_bind_retry_at = time.monotonic() + _EARLY_BIND_RETRY_INTERVAL
+        return obj
+    except Exception as e:
+        logger.debug("Early binding failed for %r, using late binding: %s", obj, e)
+        return obj
+
+
+@dataclass(slots=True)
 class WorkbookEntry:
     file_path: str
     workbook: Any  # CDispatch
     app: Any  # Excel.Application that owns this workbook
     was_already_open: bool
     is_editing: bool = False
-    opened_at: datetime = field(default_factory=datetime.now)
-    last_operation_at: datetime = field(default_factory=datetime.now)
+    # Wall-clock ns, touched on every write; datetimes are built on read
+    opened_ns: int = field(default_factory=time.time_ns, repr=False)
+    last_operation_ns: int = field(default_factory=time.time_ns, repr=False)
+    # workbook.Sheets collection proxy, fetched on first use (live collection)
+    _sheet_collection: Any = field(default=None, init=False, repr=False)
+
+    @property
+    def sheet_collection(self) -> Any:
+        coll = self._sheet_collection
+        if coll is None:
+            coll = self._sheet_collection = self.workbook.Sheets
+        return coll
+
+    @property
+    def opened_at(self) -> datetime:
+        return datetime.fromtimestamp(self.opened_ns / 1e9)
+
+    @property
+    def last_operation_at(self) -> datetime:
+        return datetime.fromtimestamp(self.last_operation_ns / 1e9)
 
 
 class ExcelInstanceManager:
     _instance: ClassVar[Optional["ExcelInstanceManager"]] = None
     _VALIDATION_INTERVAL: ClassVar[float] = 5.0  # seconds
+    _PATH_KEY_CACHE_SIZE: ClassVar[int] = 256
 
     # Type annotations only — values are set in __new__
     _app: Optional[Any]
     _app_is_attached: bool
     _registry: dict[str, WorkbookEntry]
+    _path_keys: dict[str, str]
     _last_validation_time: float
 
     def __new__(cls) -> "ExcelInstanceManager":
         if cls._instance is None:
             inst = super().__new__(cls)
             inst._registry = {}
+            inst._path_keys = {}
             inst._app = None
             inst._app_is_attached = False
             inst._last_validation_time = 0.0
@@ -77,7 +153,9 @@ class ExcelInstanceManager:
 
         # Step 2: attach to existing instance
         try:
-            self._app = win32com.client.GetActiveObject("Excel.Application")
+            self._app = _early_bind(
+                win32com.client.GetActiveObject("Excel.Application")
+            )
             self._app_is_attached = True
             logger.info(
                 "Attached to existing Excel instance (version %s)", self._app.Version
@@ -88,7 +166,7 @@ class ExcelInstanceManager:
 
         # Step 3: launch new instance
         try:
-            self._app = win32com.client.DispatchEx("Excel.Application")
+            self._app = _early_bind(win32com.client.DispatchEx("Excel.Application"))
             self._app.Visible = False
             self._app.DisplayAlerts = False
             self._app_is_attached = False
@@ -114,13 +192,19 @@ class ExcelInstanceManager:
         already open, which would cause was_already_open to be set incorrectly.
         """
         pythoncom.CoInitialize()
+        # Most ROT entries are not this file (or not files at all); compare
+        # the cheap file name first so realpath only runs on likely matches.
+        file_name = os.path.basename(norm_path)
         try:
             ctx = pythoncom.CreateBindCtx(0)
             rot = pythoncom.GetRunningObjectTable()
             for moniker in rot.EnumRunning():
                 try:
                     display = moniker.GetDisplayName(ctx, None)
-                    if normalize_path(display) == norm_path:
+                    if (
+                        os.path.normcase(display).endswith(file_name)
+                        and normalize_path(display) == norm_path
+                    ):
                         return True
                 except pythoncom.com_error:
                     continue
@@ -130,6 +214,22 @@ class ExcelInstanceManager:
 
     # ── Registry health ────────────────────────────────────────────────
 
+    def _registry_key(self, file_path: str) -> str:
+        """Return the normalized registry key for *file_path*.
+
+        normalize_path() resolves the path on disk (realpath), so keys for
+        absolute paths are memoized; relative paths depend on the cwd and are
+        always resolved.
+        """
+        norm = self._path_keys.get(file_path)
+        if norm is None:
+            norm = normalize_path(os.path.abspath(file_path))
+            if os.path.isabs(file_path):
+                if len(self._path_keys) >= self._PATH_KEY_CACHE_SIZE:
+                    self._path_keys.clear()
+                self._path_keys[file_path] = norm
+        return norm
+
     def _validate_registry(self, *, force: bool = False) -> None:
         """Remove stale entries whose COM references are dead.
 
@@ -150,7 +250,17 @@ class ExcelInstanceManager:
                 stale_keys.append(key)
         for key in stale_keys:
             logger.warning("Removing stale workbook entry: %s", key)
-            del self._registry[key]
+            self._drop_entry(key)
+
+    def _drop_entry(self, key: str) -> None:
+        """Remove a registry entry and release its cached COM references.
+
+        The Sheets collection proxy is cleared explicitly so its COM
+        reference is released now, not whenever the entry is collected.
+        """
+        entry = self._registry.pop(key, None)
+        if entry is not None:
+            entry._sheet_collection = None
 
     # ── Workbook operations ────────────────────────────────────────────
 
@@ -164,7 +274,7 @@ class ExcelInstanceManager:
         """
         self._validate_registry()
         abs_path = os.path.abspath(file_path)
-        norm = normalize_path(abs_path)
+        norm = self._registry_key(file_path)
 
         # Already in registry?
         if norm in self._registry:
@@ -174,7 +284,7 @@ class ExcelInstanceManager:
                 logger.debug("Workbook already in registry: %s", norm)
                 return entry
             except (COMError, AttributeError):
-                del self._registry[norm]
+                self._drop_entry(norm)
 
         if not os.path.exists(abs_path):
             raise WorkbookNotFoundError(f"文件不存在: {abs_path}")
@@ -185,7 +295,7 @@ class ExcelInstanceManager:
         # was_already_open=True incorrect and cause the file to never be closed.
         if self._is_file_in_rot(norm):
             try:
-                wb = win32com.client.GetObject(abs_path)
+                wb = _early_bind(win32com.client.GetObject(abs_path))
                 wb_app = wb.Application
                 logger.info(
                     "Attached to user-opened workbook via GetObject: %s", norm
@@ -226,7 +336,7 @@ class ExcelInstanceManager:
     def create_workbook(self, file_path: str) -> WorkbookEntry:
         """Create a new workbook and save it to *file_path*."""
         abs_path = os.path.abspath(file_path)
-        norm = normalize_path(abs_path)
+        norm = self._registry_key(file_path)
 
         # Guard: already tracked
         self._validate_registry()
@@ -257,7 +367,7 @@ class ExcelInstanceManager:
 
     def get_workbook(self, file_path: str) -> WorkbookEntry:
         """Get an already-open workbook entry, or open it."""
-        norm = normalize_path(os.path.abspath(file_path))
+        norm = self._registry_key(file_path)
         self._validate_registry()  # throttled — cheap on hot path
         if norm in self._registry:
             return self._registry[norm]
@@ -268,13 +378,13 @@ class ExcelInstanceManager:
         """Save a workbook."""
         entry = self.get_workbook(file_path)
         entry.workbook.Save()
-        entry.last_operation_at = datetime.now()
+        entry.last_operation_ns = time.time_ns()
         pump_messages()
         logger.info("Saved workbook: %s", entry.file_path)
 
     def close_workbook(self, file_path: str, save: bool = True) -> None:
         """Close a workbook. User-opened files are saved but not closed."""
-        norm = normalize_path(os.path.abspath(file_path))
+        norm = self._registry_key(file_path)
         self._validate_registry()
         if norm not in self._registry:
             logger.debug("Workbook not in registry, nothing to close: %s", norm)
@@ -298,7 +408,7 @@ class ExcelInstanceManager:
             pump_messages()
         except Exception as e:  # best-effort close
             logger.warning("Error closing workbook %s: %s", norm, e)
-        del self._registry[norm]
+        self._drop_entry(norm)
         logger.info("Closed workbook: %s", norm)
 
     def get_sheet(self, file_path: str, sheet: str | int | None = None) -> Any:
@@ -307,12 +417,11 @@ class ExcelInstanceManager:
         wb = entry.workbook
         if sheet is None:
             return wb.ActiveSheet
+        sheets = entry.sheet_collection
         try:
-            return wb.Sheets(sheet)
+            return sheets(sheet)
         except COMError as e:
-            available = [
-                wb.Sheets(i).Name for i in range(1, wb.Sheets.Count + 1)
-            ]
+            available = [sheets(i).Name for i in range(1, sheets.Count + 1)]
             raise SheetNotFoundError(
                 f"工作表 '{sheet}' 不存在，可用工作表: {available}", e
             )
@@ -329,19 +438,26 @@ class ExcelInstanceManager:
 
     def mark_dirty(self, file_path: str) -> None:
         """Update last_operation_at — call after tool writes to cells."""
-        norm = normalize_path(os.path.abspath(file_path))
+        norm = self._registry_key(file_path)
         entry = self._registry.get(norm)
         if entry:
-            entry.last_operation_at = datetime.now()
+            entry.last_operation_ns = time.time_ns()
 
     # ── Batch operations ───────────────────────────────────────────────
 
     class _BatchContext:
         """Context manager that optimises Excel settings for bulk writes."""
 
+        # Created for every write tool call
+        __slots__ = (
+            "_mgr", "_file_path", "_entry", "_app_ref",
+            "_prev_calc", "_prev_events", "_prev_screen", "_prev_alerts",
+        )
+
         def __init__(self, mgr: "ExcelInstanceManager", file_path: str):
             self._mgr = mgr
             self._file_path = file_path
+            self._entry: Optional[WorkbookEntry] = None
             self._app_ref: Any = None
             self._prev_calc = None
             self._prev_events = None
@@ -349,23 +465,28 @@ class ExcelInstanceManager:
             self._prev_alerts = None
 
         def __enter__(self) -> "ExcelInstanceManager._BatchContext":
-            entry = self._mgr.get_workbook(self._file_path)
+            entry = self._entry = self._mgr.get_workbook(self._file_path)
             # Use the app that *owns* this workbook — not _ensure_app(),
             # which may return a different Application instance.
             self._app_ref = entry.app
             app = self._app_ref
 
-            self._prev_calc = app.Calculation
-            self._prev_events = app.EnableEvents
-            self._prev_screen = app.ScreenUpdating
-            self._prev_alerts = app.DisplayAlerts
-
-            app.Calculation = xlCalculationManual
-            app.EnableEvents = False
-            app.DisplayAlerts = False
+            # Only settings that actually change are written and remembered;
+            # a _prev_* left as None means __exit__ has nothing to restore.
+            calc = app.Calculation
+            if calc != xlCalculationManual:
+                self._prev_calc = calc
+                app.Calculation = xlCalculationManual
+            if app.EnableEvents:
+                self._prev_events = True
+                app.EnableEvents = False
+            if app.DisplayAlerts:
+                self._prev_alerts = True
+                app.DisplayAlerts = False
             # Keep ScreenUpdating on for user-opened files so the user can
             # see changes happening in real time.
-            if not entry.was_already_open:
+            if not entry.was_already_open and app.ScreenUpdating:
+                self._prev_screen = True
                 app.ScreenUpdating = False
 
             entry.is_editing = True
@@ -376,16 +497,9 @@ class ExcelInstanceManager:
             if app is None:
                 return
 
-            # Check liveness — do NOT call _ensure_app() which would spin
-            # up a new Excel instance if the original one crashed.
-            try:
-                _ = app.Version
-            except (COMError, AttributeError):
-                logger.warning(
-                    "Excel exited during batch operation, skipping settings restore"
-                )
-                return
-
+            # Restore on the owning app directly — do NOT call _ensure_app(),
+            # which would spin up a new Excel instance if this one crashed.
+            # A dead app fails the first write, so no separate liveness probe.
             try:
                 if self._prev_calc is not None:
                     app.Calculation = self._prev_calc
@@ -398,11 +512,10 @@ class ExcelInstanceManager:
             except (COMError, AttributeError) as e:
                 logger.warning("Error restoring Excel settings: %s", e)
 
-            norm = normalize_path(os.path.abspath(self._file_path))
-            entry = self._mgr._registry.get(norm)
-            if entry:
+            entry = self._entry
+            if entry is not None:
                 entry.is_editing = False
-                entry.last_operation_at = datetime.now()
+                entry.last_operation_ns = time.time_ns()
 
     def batch_operation(self, file_path: str) -> _BatchContext:
         """Return a context manager that optimises Excel for batch ops."""
@@ -443,14 +556,14 @@ class ExcelInstanceManager:
                 else:
                     entry.workbook.Close(SaveChanges=True)
                     pump_messages()
-                    del self._registry[key]
+                    self._drop_entry(key)
                     logger.info("Closed agent-opened workbook: %s", key)
             except Exception as e:  # best-effort — COM may already be dead
                 logger.warning("Error closing %s: %s", key, e)
                 # User-opened: keep entry, will be cleaned up by next validation.
                 # Agent-opened: COM reference is likely dead, remove now.
                 if not entry.was_already_open:
-                    self._registry.pop(key, None)
+                    self._drop_entry(key)
 
         if quit_app_if_empty and self._app and not self._app_is_attached:
             try:
@@ -467,4 +580,9 @@ class ExcelInstanceManager:
 
     def cleanup(self) -> None:
         """Close all workbooks and quit agent-owned Excel instance."""
-        self._close_registry_entries(quit_app_if_empty=True)
\ No newline at end of file
+        self._close_registry_entries(quit_app_if_empty=True)
+        # Process teardown: drop the remaining (user-opened) workbook and
+        # sheet proxies too, so no COM reference outlives the manager.
+        for key in list(self._registry):
+            self._drop_entry(key)
+        self._path_keys.clear()
\ No newline at end of file
@@ -13,8 +13,9 @@ def list_queries(wb: Any) -> list[dict[str, str]]:
     """List all Power Query queries in the workbook."""
     result = []
     try:
-        for i in range(1, wb.Queries.Count + 1):
-            q = wb.Queries(i)
+        queries = wb.Queries
+        for i in range(1, queries.Count + 1):
+            q = queries(i)
             result.append(
                 {
                     "name": q.Name,
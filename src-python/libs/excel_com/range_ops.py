@@ -1,13 +1,14 @@
 """Range read/write operations for Excel COM."""
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 import pywintypes
 
 from .errors import RangeError
-from .utils import com_retry, pump_messages
+from .utils import com_retry, is_transient, pump_messages
 
 logger = logging.getLogger("app.excel")
 
@@ -16,12 +17,16 @@ MAX_RETURN_ROWS = 100
 
 def _convert_value(val: Any) -> Any:
     """Convert COM values to Python-friendly types."""
-    if val is None:
-        return None
+    # Called once per cell: check the common exact types (text, numbers,
+    # blanks) before the isinstance test for dates.
+    cls = type(val)
+    if cls is str or val is None:
+        return val
+    if cls is float:
+        # is_integer() is also safe for inf/nan, where int() would raise
+        return int(val) if val.is_integer() else val
     if isinstance(val, pywintypes.TimeType):
         return datetime.fromtimestamp(val.timestamp()).strftime("%Y-%m-%d")
-    if isinstance(val, float) and val == int(val):
-        return int(val)
     return val
 
 
@@ -31,35 +36,47 @@ def _values_to_list(raw: Any) -> list[list[Any]]:
         return [[None]]
     if not isinstance(raw, tuple):
         return [[_convert_value(raw)]]
-    result = []
-    for row in raw:
-        if isinstance(row, tuple):
-            result.append([_convert_value(c) for c in row])
-        else:
-            result.append([_convert_value(row)])
-    return result
+    convert = _convert_value
+    return [
+        [convert(c) for c in row] if type(row) is tuple else [convert(row)]
+        for row in raw
+    ]
 
 
 @com_retry(max_retries=2, delay=0.5)
-def read_range(sheet: Any, range_address: str) -> list[list[Any]]:
-    """Read a range and return as 2D list."""
+def read_range(
+    sheet: Any, range_address: str, use_value2: bool = False
+) -> list[list[Any]]:
+    """Read a range and return as 2D list.
+
+    With *use_value2*, cells are read through Value2, which skips Excel's
+    Date/Currency conversion: cheaper for large numeric ranges, but dates
+    come back as serial numbers instead of 'YYYY-MM-DD' strings.
+    """
     try:
         rng = sheet.Range(range_address)
     except Exception as e:
         raise RangeError(f"无效的区域地址 '{range_address}': {e}", e)
-    raw = rng.Value
+    raw = rng.Value2 if use_value2 else rng.Value
     return _values_to_list(raw)
 
 
-def read_used_range(sheet: Any) -> tuple[str, list[list[Any]], int, int]:
-    """Read the used range. Returns (address, data, total_rows, total_cols)."""
+def read_used_range(
+    sheet: Any, max_rows: int | None = None, use_value2: bool = False
+) -> tuple[str, list[list[Any]], int, int]:
+    """Read the used range. Returns (address, data, total_rows, total_cols).
+
+    With *max_rows*, only the first max_rows rows are transferred from
+    Excel; total_rows still reports the full used range.
+    """
     ur = sheet.UsedRange
     if ur is None:
         return ("A1", [[]], 0, 0)
     addr = ur.Address
     total_rows = ur.Rows.Count
     total_cols = ur.Columns.Count
-    raw = ur.Value
+    rng = ur.Resize(max_rows) if max_rows and total_rows > max_rows else ur
+    raw = rng.Value2 if use_value2 else rng.Value
     data = _values_to_list(raw)
     return (addr, data, total_rows, total_cols)
 
@@ -73,16 +90,11 @@ def write_range(sheet: Any, start_cell: str, values: list[list[Any]]) -> str:
     cols = len(values[0])
     try:
         start = sheet.Range(start_cell)
-        end = start.Offset(rows, cols)
-        target = sheet.Range(start, end.Offset(-1, -1) if rows > 0 else start)
-        # Build proper range from start to end
-        r1 = start.Row
-        c1 = start.Column
-        target = sheet.Range(
-            sheet.Cells(r1, c1),
-            sheet.Cells(r1 + rows - 1, c1 + cols - 1),
-        )
-        target.Value = values
+        # Resize from the start cell: one call instead of Cells()/Range() pairs
+        target = start.Resize(rows, cols)
+        # Values arrive as JSON scalars (no date/currency VARIANTs), so
+        # Value2 stores them identically while skipping that conversion layer
+        target.Value2 = values
         pump_messages()
         return target.Address
     except Exception as e:
@@ -104,3 +116,65 @@ def set_number_format(sheet: Any, range_address: str, fmt: str) -> None:
     """Set number format on a range."""
     sheet.Range(range_address).NumberFormat = fmt
     pump_messages()
+
+
+# Range() accepts comma-joined areas up to 255 characters of address
+_MAX_UNION_ADDRESS = 255
+
+
+@com_retry(max_retries=2, delay=0.5)
+def set_number_formats(sheet: Any, formats: list[tuple[str, str]]) -> None:
+    """Apply several (range_address, format) pairs with one write per format.
+
+    Ranges sharing a format are joined into a multi-area address, so N
+    ranges cost one COM property write per distinct format instead of N.
+    """
+    by_format: dict[str, list[str]] = {}
+    for address, fmt in formats:
+        by_format.setdefault(fmt, []).append(address)
+
+    for fmt, addresses in by_format.items():
+        for union in _union_addresses(addresses):
+            _write_number_format(sheet, union, fmt)
+    pump_messages()
+
+
+@com_retry(max_retries=2, delay=0.5)
+def apply_style(sheet: Any, range_addresses: list[str], style_name: str) -> None:
+    """Apply a named workbook style (e.g. 'Heading 1', 'Total') to ranges.
+
+    A style carries font, fill, border and number format together, so this
+    is one Style write per multi-area chunk instead of a write per property.
+    """
+    for union in _union_addresses(range_addresses):
+        try:
+            sheet.Range(union).Style = style_name
+        except pywintypes.com_error as e:
+            if is_transient(e):
+                raise  # left unwrapped so com_retry retries it
+            raise RangeError(f"应用样式 '{style_name}' 到 '{union}' 失败: {e}", e)
+    pump_messages()
+
+
+def _union_addresses(addresses: list[str]) -> Iterator[str]:
+    """Join addresses into comma-separated chunks that Range() accepts."""
+    chunk: list[str] = []
+    size = 0
+    for address in addresses:
+        if chunk and size + 1 + len(address) > _MAX_UNION_ADDRESS:
+            yield ",".join(chunk)
+            chunk.clear()
+            size = 0
+        chunk.append(address)
+        size += len(address) + (1 if size else 0)
+    if chunk:
+        yield ",".join(chunk)
+
+
+def _write_number_format(sheet: Any, address: str, fmt: str) -> None:
+    try:
+        sheet.Range(address).NumberFormat = fmt
+    except pywintypes.com_error as e:
+        if is_transient(e):
+            raise  # left unwrapped so com_retry retries it
+        raise RangeError(f"设置区域 '{address}' 格式失败: {e}", e)
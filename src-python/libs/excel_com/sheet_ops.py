@@ -11,7 +11,8 @@ logger = logging.getLogger("app.excel")
 
 def list_sheets(wb: Any) -> list[str]:
     """Return all sheet names in the workbook."""
-    return [wb.Sheets(i).Name for i in range(1, wb.Sheets.Count + 1)]
+    sheets = wb.Sheets
+    return [sheets(i).Name for i in range(1, sheets.Count + 1)]
 
 
 @com_retry(max_retries=2, delay=0.5)
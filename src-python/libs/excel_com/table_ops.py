@@ -37,8 +37,9 @@ def create_table(
 def list_tables(sheet: Any) -> list[dict[str, str]]:
     """List all tables on a sheet."""
     result = []
-    for i in range(1, sheet.ListObjects.Count + 1):
-        tbl = sheet.ListObjects(i)
+    objs = sheet.ListObjects
+    for i in range(1, objs.Count + 1):
+        tbl = objs(i)
         result.append(
             {
                 "name": tbl.Name,
@@ -81,12 +82,13 @@ def add_table_column(
         if formula and tbl.ListRows.Count > 0:
             # Re-fetch column reference after pump
             col = tbl.ListColumns(column_name)
+            body = col.DataBodyRange
             try:
-                col.DataBodyRange.Formula = formula
+                body.Formula = formula
             except Exception:
-                # Fallback: set cell by cell
-                for cell in col.DataBodyRange:
-                    cell.Formula = formula
+                # Fallback: write the formula per cell as one 2D array, a
+                # single COM call instead of a round trip per row
+                body.Formula = [[formula]] * body.Rows.Count
             pump_messages()
         logger.info("Added column '%s' to table '%s'", column_name, table_name)
     except Exception as e:
@@ -104,11 +106,11 @@ def delete_table(sheet: Any, table_name: str) -> None:
 
 def _get_table(sheet: Any, table_name: str) -> Any:
     """Find a table by name on a sheet."""
-    for i in range(1, sheet.ListObjects.Count + 1):
-        tbl = sheet.ListObjects(i)
-        if tbl.Name == table_name:
-            return tbl
-    available = [
-        sheet.ListObjects(i).Name for i in range(1, sheet.ListObjects.Count + 1)
-    ]
-    raise TableError(f"表格 '{table_name}' 不存在，可用表格: {available}")
+    # ListObjects(name) is a single keyed lookup, case-insensitive like Excel's
+    # own table names; the collection is only scanned to build the error.
+    try:
+        return sheet.ListObjects(table_name)
+    except pythoncom.com_error as e:
+        objs = sheet.ListObjects
+        available = [objs(i).Name for i in range(1, objs.Count + 1)]
+        raise TableError(f"表格 '{table_name}' 不存在，可用表格: {available}", e)
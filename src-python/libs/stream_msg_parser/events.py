@@ -4,19 +4,25 @@ This module defines event classes for parsing LangGraph AIMessage
 streaming output in "messages" stream mode.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """Base event class for stream parser."""
 
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Wall-clock ns; a datetime is only built when timestamp is read
+    _ts_ns: int = field(default_factory=time.time_ns, init=False, repr=False)
 
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self._ts_ns / 1e9)
 
-@dataclass
+
+@dataclass(slots=True)
 class ContentEvent(StreamEvent):
     """Content (text or reasoning) event from AIMessage.
 
@@ -29,7 +35,7 @@ class ContentEvent(StreamEvent):
     node: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallStartEvent(StreamEvent):
     """Tool call started event.
 
@@ -44,7 +50,7 @@ class ToolCallStartEvent(StreamEvent):
     args: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallArgsEvent(StreamEvent):
     """Tool call arguments chunk event (for streaming args).
 
@@ -59,7 +65,7 @@ class ToolCallArgsEvent(StreamEvent):
     args: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallEndEvent(StreamEvent):
     """Tool call completed event.
 
@@ -80,7 +86,7 @@ class ToolCallEndEvent(StreamEvent):
     duration_ms: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent(StreamEvent):
     """Error event.
 
@@ -91,7 +97,7 @@ class ErrorEvent(StreamEvent):
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CompleteEvent(StreamEvent):
     """Stream completed event."""
 
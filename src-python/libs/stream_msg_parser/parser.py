@@ -18,6 +18,12 @@ from .events import (
     ToolCallStartEvent,
 )
 
+# Content block type -> (payload key, node override; None keeps the source node)
+_CONTENT_BLOCKS: dict[str, tuple[str, Optional[str]]] = {
+    "text": ("text", None),
+    "reasoning": ("reasoning", "thinking"),
+}
+
 
 class MessageParser:
     """Parser for LangGraph message stream mode.
@@ -44,6 +50,9 @@ class MessageParser:
             set()
         )  # Track tool calls we've already emitted
         self._current_tool_call_id: str = ""  # Track current tool call being streamed
+        # langchain message classes, bound lazily in aparse()
+        self._ai_message_cls: Any = None
+        self._tool_message_cls: Any = None
 
     async def aparse(
         self, stream: AsyncGenerator[tuple[Any, dict[str, Any]], None]
@@ -57,6 +66,12 @@ class MessageParser:
         Yields:
             StreamEvent instances representing the parsed stream
         """
+        # Resolve message classes once per stream instead of once per token
+        from langchain_core.messages import AIMessage, ToolMessage
+
+        self._ai_message_cls = AIMessage
+        self._tool_message_cls = ToolMessage
+
         try:
             async for message, metadata in stream:
                 try:
@@ -89,22 +104,15 @@ class MessageParser:
         Returns:
             List of parsed events
         """
-        events: list[Optional[StreamEvent]] = []
-
-        # Import here to avoid circular imports
-        from langchain_core.messages import AIMessage
-        from langchain_core.messages import ToolMessage
-
-        if isinstance(message, AIMessage):
+        if isinstance(message, self._ai_message_cls):
             # Handle AIMessage - extract content and tool calls
-            events.extend(self._parse_ai_message(node_name, message))
+            return self._parse_ai_message(node_name, message)
 
-        elif isinstance(message, ToolMessage):
+        if isinstance(message, self._tool_message_cls) and self._track_tool_lifecycle:
             # Handle ToolMessage - tool result
-            if self._track_tool_lifecycle:
-                events.append(self._parse_tool_result(message))
+            return [self._parse_tool_result(message)]
 
-        return events
+        return []
 
     def _parse_ai_message(
         self, node_name: str, message: Any
@@ -123,49 +131,39 @@ class MessageParser:
         # Handle content (text) - preserve whitespace including newlines
         content = message.content
         if content:
-            if isinstance(content, str):
+            content_type = type(content)
+            if content_type is str:
                 # Don't skip whitespace - emit all content including newlines
-                if content:
-                    events.append(ContentEvent(content=content, node=node_name))
-            elif isinstance(content, list):
+                events.append(ContentEvent(content=content, node=node_name))
+            elif content_type is list:
                 # Handle list content (e.g., multiple content blocks)
                 for item in content:
-                    if isinstance(item, dict):
-                        item_type = item.get("type", "")
-                        if item_type == "text":
-                            text = item.get("text", "")
-                            if text:  # Emit all text including whitespace
-                                events.append(
-                                    ContentEvent(content=text, node=node_name)
-                                )
-                        elif item_type == "reasoning":
-                            reasoning = item.get("reasoning", "")
-                            if reasoning:
-                                events.append(
-                                    ContentEvent(content=reasoning, node="thinking")
-                                )
+                    if type(item) is not dict:
+                        continue
+                    block = _CONTENT_BLOCKS.get(item.get("type"))
+                    if block is None:
+                        continue
+                    key, node = block
+                    value = item.get(key)
+                    if value:  # Emit all text including whitespace
+                        events.append(ContentEvent(content=value, node=node or node_name))
 
         # Handle reasoning content (newer langchain versions)
-        if hasattr(message, "reasoning") and message.reasoning:
-            reasoning = message.reasoning
-            if reasoning:
-                events.append(ContentEvent(content=reasoning, node="thinking"))
-
-        # Handle tool call chunks (streaming arguments)
-        if (
-            self._track_tool_lifecycle
-            and hasattr(message, "tool_call_chunks")
-            and message.tool_call_chunks
-        ):
-            for chunk in message.tool_call_chunks:
+        reasoning = getattr(message, "reasoning", None)
+        if reasoning:
+            events.append(ContentEvent(content=reasoning, node="thinking"))
+
+        if not self._track_tool_lifecycle:
+            return events
+
+        # Handle tool call chunks (streaming arguments); only message chunks have them
+        tool_call_chunks = getattr(message, "tool_call_chunks", None)
+        if tool_call_chunks:
+            for chunk in tool_call_chunks:
                 events.extend(self._parse_tool_call_chunk(chunk))
 
         # Handle tool calls (complete tool calls)
-        if (
-            self._track_tool_lifecycle
-            and hasattr(message, "tool_calls")
-            and message.tool_calls
-        ):
+        if message.tool_calls:
             for tool_call in message.tool_calls:
                 # Only emit if we haven't seen this tool call ID before
                 tool_id = tool_call.get("id", "")
@@ -174,11 +172,7 @@ class MessageParser:
                     events.append(self._parse_tool_call(tool_call))
 
         # Handle invalid tool calls (errors)
-        if (
-            self._track_tool_lifecycle
-            and hasattr(message, "invalid_tool_calls")
-            and message.invalid_tool_calls
-        ):
+        if message.invalid_tool_calls:
             for invalid_call in message.invalid_tool_calls:
                 error = invalid_call.get("error")
                 if error:
@@ -258,7 +252,8 @@ class MessageParser:
             ToolCallEndEvent
         """
         tool_call_id = message.tool_call_id
-        tool_name = message.name if hasattr(message, "name") else ""
+        # ToolMessage always declares name (None when unset)
+        tool_name = message.name or ""
         content = message.content
 
         # Calculate duration
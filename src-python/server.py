@@ -42,6 +42,9 @@ async def lifespan(app: FastAPI):
     app.state.project_service = ProjectService()
     app.state.webview_window = _webview_window
     yield
+    from agent.checkpoint import close_sqlite_savers
+
+    await close_sqlite_savers()
     shutdown_com_thread()
 
 
@@ -83,10 +83,8 @@ class ProjectService:
                 return self._core
             import os
 
-            from agent.config import AgentConfig
             from agent.core import AgentCore
             from agent.model_provider import ModelProvider
-            from tools.excel_tools import CompositeExcelToolProvider
 
             entry = _resolve_model_entry(settings, settings.main_model_id)
             if entry is None:
@@ -101,26 +99,34 @@ class ProjectService:
                 if provider_cfg:
                     os.environ[provider_cfg.api_key_env] = entry.api_key
 
-            project_root = self.get_active_root()
-            if project_root:
-                from agent.project import get_project_agent_paths
-
-                agents_md, skills = get_project_agent_paths(project_root)
-                config = AgentConfig(
-                    model=model_spec,
-                    working_dir=project_root,
-                    agents_md_path=agents_md,
-                    skills_path=skills,
-                    tool_providers=[CompositeExcelToolProvider()],
-                )
-            else:
-                config = AgentConfig(
-                    model=model_spec,
-                    tool_providers=[CompositeExcelToolProvider()],
-                )
+            # AgentCore reuses a cached compiled graph for a known config
+            config = self._build_config(model_spec, self.get_active_root())
             self._core = AgentCore(config)
         return self._core
 
+    @staticmethod
+    def _build_config(model_spec: str, project_root: Optional[Path]):
+        from agent.config import AgentConfig
+        from tools.excel_tools import CompositeExcelToolProvider
+
+        if project_root is None:
+            return AgentConfig(
+                model=model_spec,
+                tool_providers=[CompositeExcelToolProvider()],
+            )
+
+        from agent.project import get_project_agent_paths, get_project_checkpoint_path
+
+        agents_md, skills = get_project_agent_paths(project_root)
+        return AgentConfig(
+            model=model_spec,
+            working_dir=project_root,
+            agents_md_path=agents_md,
+            skills_path=skills,
+            tool_providers=[CompositeExcelToolProvider()],
+            checkpoint_path=get_project_checkpoint_path(project_root),
+        )
+
     def _reset_core(self) -> None:
         with self._core_lock:
             self._core = None
@@ -191,6 +197,7 @@ class ProjectService:
                 api_key=entry.api_key,
                 provider=provider,
                 project_root=root,
+                response_cache_enabled=settings.response_cache_enabled,
             )
 
             agent_md_path = root / PROJECT_DIR_NAME / AGENT_MD_NAME
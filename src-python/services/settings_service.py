@@ -28,6 +28,8 @@ class AppSettings(BaseModel):
     subagents_model_id: Optional[str] = None
     analysis_model_id: Optional[str] = None
     language: str = "zh-CN"
+    # Reuse cached analysis formatting for unchanged sources (llm_cache.json)
+    response_cache_enabled: bool = False
 
 
 def _migrate_old_format(data: dict) -> AppSettings:
@@ -68,20 +70,35 @@ def _migrate_old_format(data: dict) -> AppSettings:
 
 
 class SettingsService:
+    def __init__(self) -> None:
+        # Parsed settings keyed by the file's (mtime_ns, size); every stream
+        # request resolves settings, and the file rarely changes
+        self._cache: Optional[tuple[tuple[int, int], AppSettings]] = None
+
     def load(self) -> AppSettings:
         try:
-            if _SETTINGS_FILE.exists():
-                data = json.loads(_SETTINGS_FILE.read_text())
-                # Detect old format by presence of top-level "provider" key
-                if "provider" in data:
-                    logger.info("Migrating settings from old format")
-                    settings = _migrate_old_format(data)
-                    self.save(settings)
-                    return settings
-                return AppSettings(**data)
+            st = _SETTINGS_FILE.stat()
+        except OSError:
+            return AppSettings()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._cache
+        if cached is not None and cached[0] == stamp:
+            # Callers may mutate the result; hand out a copy
+            return cached[1].model_copy(deep=True)
+        try:
+            data = json.loads(_SETTINGS_FILE.read_text())
+            # Detect old format by presence of top-level "provider" key
+            if "provider" in data:
+                logger.info("Migrating settings from old format")
+                settings = _migrate_old_format(data)
+                self.save(settings)
+                return settings
+            settings = AppSettings(**data)
         except Exception as e:
             logger.warning("Failed to load settings: %s", e)
-        return AppSettings()
+            return AppSettings()
+        self._cache = (stamp, settings.model_copy(deep=True))
+        return settings
 
     def save(self, settings: AppSettings) -> None:
         # Guard: if api_key == "********", restore real key from existing stored entry
@@ -104,6 +121,7 @@ class SettingsService:
 
         _SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
         _SETTINGS_FILE.write_text(json.dumps(settings.model_dump(), indent=2))
+        self._cache = None
 
     def load_masked(self) -> dict:
         s = self.load()
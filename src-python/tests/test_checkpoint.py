@@ -0,0 +1,55 @@
+"""Tests for BoundedMemorySaver eviction."""
+
+import pytest
+
+pytest.importorskip("langgraph.checkpoint.memory")
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from agent.checkpoint import BoundedMemorySaver
+
+
+def _put(saver: BoundedMemorySaver, thread_id: str) -> None:
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    saver.put(config, empty_checkpoint(), {}, {})
+
+
+@pytest.fixture
+def saver(monkeypatch):
+    saver = BoundedMemorySaver(max_threads=2)
+    deleted: list[str] = []
+    original = saver.delete_thread
+
+    def record(thread_id: str) -> None:
+        deleted.append(thread_id)
+        original(thread_id)
+
+    monkeypatch.setattr(saver, "delete_thread", record)
+    saver.deleted = deleted
+    return saver
+
+
+def test_no_eviction_within_limit(saver):
+    _put(saver, "a")
+    _put(saver, "b")
+    assert saver.deleted == []
+    assert list(saver._threads) == ["a", "b"]
+
+
+def test_evicts_least_recently_written(saver):
+    _put(saver, "a")
+    _put(saver, "b")
+    _put(saver, "c")
+    assert saver.deleted == ["a"]
+    assert list(saver._threads) == ["b", "c"]
+    assert "a" not in saver.storage
+
+
+def test_rewrite_refreshes_thread(saver):
+    _put(saver, "a")
+    _put(saver, "b")
+    _put(saver, "a")
+    _put(saver, "c")
+    assert saver.deleted == ["b"]
+    assert list(saver._threads) == ["a", "c"]
+    assert "a" in saver.storage
@@ -0,0 +1,53 @@
+"""Tests for _JsonScanner, which detects when streamed tool args are complete."""
+
+import pytest
+
+pytest.importorskip("orjson")
+
+from agent.core import _JsonScanner, _value_end
+
+
+def _feed_all(chunks: list[str]) -> list[bool]:
+    scanner = _JsonScanner()
+    return [scanner.feed(chunk) for chunk in chunks]
+
+
+def test_complete_only_when_outer_object_closes():
+    assert _feed_all(['{"todos": [', '{"content": "a"}', "]", "}"]) == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_whole_value_in_one_chunk():
+    assert _feed_all(['{"todos": []}']) == [True]
+
+
+def test_not_complete_before_any_bracket():
+    assert _feed_all(["", "  "]) == [False, False]
+
+
+def test_brackets_inside_strings_are_ignored():
+    assert _feed_all(['{"a": "}]', '{["', "}"]) == [False, False, True]
+
+
+def test_escaped_quote_does_not_end_string():
+    assert _feed_all(['{"a": "x\\"}', '"}']) == [False, True]
+
+
+def test_escape_split_across_chunks():
+    assert _feed_all(['{"a": "x\\', '"}', '"}']) == [False, False, True]
+
+
+def test_value_end_skips_nested_dicts_and_quoted_braces():
+    frame = (
+        "{'id': 'rs_1', 'summary': [{'type': 'summary_text', "
+        "'text': \"it's {x}\"}], 'type': 'reasoning'}"
+    )
+    assert _value_end(frame + " answer") == len(frame) - 1
+
+
+def test_value_end_unclosed():
+    assert _value_end("{'id': 'rs_1', 'summary': [") == -1
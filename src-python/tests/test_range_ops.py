@@ -0,0 +1,41 @@
+"""Tests for multi-area address chunking in range_ops."""
+
+import pytest
+
+pytest.importorskip("pywintypes")
+
+from libs.excel_com.range_ops import _MAX_UNION_ADDRESS, _union_addresses
+
+
+def test_short_list_is_one_chunk():
+    assert list(_union_addresses(["A1:B2", "D4", "F1:F9"])) == ["A1:B2,D4,F1:F9"]
+
+
+def test_empty_input_yields_nothing():
+    assert list(_union_addresses([])) == []
+
+
+def test_chunks_stay_within_limit_and_keep_order():
+    addresses = [f"A{i}:C{i}" for i in range(1, 201)]
+    chunks = list(_union_addresses(addresses))
+    assert len(chunks) > 1
+    assert all(len(chunk) <= _MAX_UNION_ADDRESS for chunk in chunks)
+    assert ",".join(chunks).split(",") == addresses
+
+
+def test_chunk_filled_exactly_to_limit():
+    # 51 five-char addresses joined by commas are exactly 305 chars; the
+    # first chunk takes 42 of them (42 * 5 + 41 = 251), the 43rd would overflow
+    addresses = [f"A{i:04d}" for i in range(51)]
+    chunks = list(_union_addresses(addresses))
+    assert [len(c) for c in chunks] == [251, 53]
+
+
+def test_address_longer_than_limit_is_passed_alone():
+    long_address = ",".join(f"A{i}" for i in range(100))
+    assert len(long_address) > _MAX_UNION_ADDRESS
+    assert list(_union_addresses(["B1", long_address, "C1"])) == [
+        "B1",
+        long_address,
+        "C1",
+    ]
@@ -9,6 +9,7 @@ from .formula_tool import FormulaToolProvider
 from .table_tool import TableToolProvider
 from .sheet_tool import SheetToolProvider
 from .format_tool import FormatToolProvider
+from ._common import attach_coroutine
 
 
 class CompositeExcelToolProvider:
@@ -25,6 +26,11 @@ class CompositeExcelToolProvider:
             SheetToolProvider(self._manager),
             FormatToolProvider(self._manager),
         ]
+        self._tools: list | None = None
 
     def get_tools(self) -> list:
-        return [t for p in self._providers for t in p.get_tools()]
+        if self._tools is None:
+            self._tools = [
+                attach_coroutine(t) for p in self._providers for t in p.get_tools()
+            ]
+        return list(self._tools)
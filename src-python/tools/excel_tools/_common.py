@@ -1,13 +1,15 @@
 """Common utilities for Excel tools layer."""
 
-import json
 import logging
 import time
 import traceback
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable
 
-from libs.excel_com.com_thread import run_on_com_thread
+import orjson
+from langchain_core.tools import StructuredTool
+
+from libs.excel_com.com_thread import arun_on_com_thread, run_on_com_thread
 from libs.excel_com.errors import ExcelComError
 
 logger = logging.getLogger("app.excel")
@@ -15,16 +17,41 @@ logger = logging.getLogger("app.excel")
 
 def format_result(success: bool, results: list[dict], file_saved: bool = False) -> str:
     """Format tool results as JSON string."""
-    return json.dumps(
+    # orjson writes non-ASCII as UTF-8 like ensure_ascii=False, in one C pass
+    return orjson.dumps(
         {"success": success, "results": results, "file_saved": file_saved},
-        ensure_ascii=False,
         default=str,
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+def _error_result(func: Callable, t0: float, e: Exception) -> str:
+    elapsed = (time.perf_counter() - t0) * 1000
+    if isinstance(e, ExcelComError):
+        logger.error(
+            "Tool %s ExcelComError in %.0fms: %s",
+            func.__name__,
+            elapsed,
+            e.user_message,
+        )
+        return format_result(False, [{"status": "error", "message": e.user_message}])
+    logger.error(
+        "Tool %s unexpected error in %.0fms: %s\n%s",
+        func.__name__,
+        elapsed,
+        e,
+        traceback.format_exc(),
     )
+    return format_result(False, [{"status": "error", "message": f"内部错误: {e}"}])
 
 
 def safe_excel_call(func: Callable) -> Callable:
     """Decorator that dispatches the call onto the dedicated COM thread
-    and catches Excel errors, returning structured error strings."""
+    and catches Excel errors, returning structured error strings.
+
+    The returned wrapper also carries an ``acall`` coroutine with the same
+    behaviour, used as the tool's async entry point (see `attach_coroutine`).
+    """
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> str:
@@ -34,28 +61,33 @@ def safe_excel_call(func: Callable) -> Callable:
             elapsed = (time.perf_counter() - t0) * 1000
             logger.info("Tool %s completed in %.0fms", func.__name__, elapsed)
             return result
-        except ExcelComError as e:
-            elapsed = (time.perf_counter() - t0) * 1000
-            logger.error(
-                "Tool %s ExcelComError in %.0fms: %s",
-                func.__name__,
-                elapsed,
-                e.user_message,
-            )
-            return format_result(
-                False, [{"status": "error", "message": e.user_message}]
-            )
         except Exception as e:
+            return _error_result(func, t0, e)
+
+    async def acall(*args: Any, **kwargs: Any) -> str:
+        t0 = time.perf_counter()
+        try:
+            result = await arun_on_com_thread(func, *args, **kwargs)
             elapsed = (time.perf_counter() - t0) * 1000
-            logger.error(
-                "Tool %s unexpected error in %.0fms: %s\n%s",
-                func.__name__,
-                elapsed,
-                e,
-                traceback.format_exc(),
-            )
-            return format_result(
-                False, [{"status": "error", "message": f"内部错误: {e}"}]
-            )
+            logger.info("Tool %s completed in %.0fms", func.__name__, elapsed)
+            return result
+        except Exception as e:
+            return _error_result(func, t0, e)
 
+    wrapper.acall = acall  # type: ignore[attr-defined]
     return wrapper
+
+
+def attach_coroutine(tool: StructuredTool) -> StructuredTool:
+    """Give a `safe_excel_call` tool an async entry point.
+
+    Without a coroutine, LangChain runs sync tools via ``run_in_executor``, so
+    every parallel Excel tool call parks a worker thread while it waits for the
+    COM thread. The coroutine awaits the COM result on the event loop instead.
+    """
+    func = tool.func
+    acall = getattr(func, "acall", None)
+    if tool.coroutine is None and acall is not None:
+        owner = getattr(func, "__self__", None)
+        tool.coroutine = partial(acall, owner) if owner is not None else acall
+    return tool
@@ -20,12 +20,40 @@ class SetNumberFormatInput(BaseModel):
     save: bool = Field(default=True, description="操作后是否保存")
 
 
+class NumberFormatItem(BaseModel):
+    range_address: str = Field(description="要设置格式的区域")
+    number_format: str = Field(description="数字格式字符串")
+
+
+class SetNumberFormatsInput(BaseModel):
+    file_path: str = Field(description="Excel文件路径")
+    sheet: str | None = Field(default=None, description="工作表名称")
+    formats: list[NumberFormatItem] = Field(min_length=1, description="区域与格式列表")
+    save: bool = Field(default=True, description="操作后是否保存")
+
+
+class ApplyStyleInput(BaseModel):
+    file_path: str = Field(description="Excel文件路径")
+    sheet: str | None = Field(default=None, description="工作表名称")
+    range_addresses: list[str] = Field(
+        min_length=1, description="要应用样式的区域列表"
+    )
+    style_name: str = Field(
+        description="工作簿中的样式名称(如'Heading 1', 'Total', 'Good', 'Currency')"
+    )
+    save: bool = Field(default=True, description="操作后是否保存")
+
+
 class AutoFitInput(BaseModel):
     file_path: str = Field(description="Excel文件路径")
     sheet: str | None = Field(default=None, description="工作表名称")
     range_address: str | None = Field(
         default=None, description="区域，为空则自动调整所有列"
     )
+    sheets: list[str] | None = Field(
+        default=None,
+        description="一次调整多个工作表的所有列（批量），指定时忽略 sheet 和 range_address",
+    )
     save: bool = Field(default=True, description="操作后是否保存")
 
 
@@ -45,6 +73,24 @@ class FormatToolProvider:
                 args_schema=SetNumberFormatInput,
                 func=self._set_format,
             ),
+            StructuredTool(
+                name="set_number_formats",
+                description=(
+                    "一次设置多个区域的数字格式（批量），"
+                    "比多次调用 set_number_format 更快。"
+                ),
+                args_schema=SetNumberFormatsInput,
+                func=self._set_formats,
+            ),
+            StructuredTool(
+                name="apply_cell_style",
+                description=(
+                    "对一个或多个区域应用工作簿的命名样式（字体、填充、边框、"
+                    "数字格式一次设置），适合标题行、合计行等重复格式。"
+                ),
+                args_schema=ApplyStyleInput,
+                func=self._apply_style,
+            ),
             StructuredTool(
                 name="auto_fit_columns",
                 description="自动调整列宽以适应内容。",
@@ -62,8 +108,9 @@ class FormatToolProvider:
         sheet: str | None = None,
         save: bool = True,
     ) -> str:
-        ws = self._mgr.get_sheet(file_path, sheet)
-        range_ops.set_number_format(ws, range_address, number_format)
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            range_ops.set_number_format(ws, range_address, number_format)
         if save:
             self._mgr.save_workbook(file_path)
         return format_result(
@@ -77,24 +124,85 @@ class FormatToolProvider:
             file_saved=save,
         )
 
+    @safe_excel_call
+    def _set_formats(
+        self,
+        file_path: str,
+        formats: list[NumberFormatItem],
+        sheet: str | None = None,
+        save: bool = True,
+    ) -> str:
+        pairs = [(f.range_address, f.number_format) for f in formats]
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            range_ops.set_number_formats(ws, pairs)
+        if save:
+            self._mgr.save_workbook(file_path)
+        return format_result(
+            True,
+            [
+                {
+                    "status": "ok",
+                    "message": f"已设置 {len(pairs)} 个区域的格式",
+                }
+            ],
+            file_saved=save,
+        )
+
+    @safe_excel_call
+    def _apply_style(
+        self,
+        file_path: str,
+        range_addresses: list[str],
+        style_name: str,
+        sheet: str | None = None,
+        save: bool = True,
+    ) -> str:
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            range_ops.apply_style(ws, range_addresses, style_name)
+        if save:
+            self._mgr.save_workbook(file_path)
+        return format_result(
+            True,
+            [
+                {
+                    "status": "ok",
+                    "message": f"已对 {len(range_addresses)} 个区域应用样式: {style_name}",
+                }
+            ],
+            file_saved=save,
+        )
+
     @safe_excel_call
     def _auto_fit(
         self,
         file_path: str,
         sheet: str | None = None,
         range_address: str | None = None,
+        sheets: list[str] | None = None,
         save: bool = True,
     ) -> str:
-        ws = self._mgr.get_sheet(file_path, sheet)
-        range_ops.auto_fit_columns(ws, range_address)
+        with self._mgr.batch_operation(file_path):
+            if sheets:
+                # One settings toggle and one save for all sheets
+                for name in sheets:
+                    ws = self._mgr.get_sheet(file_path, name)
+                    range_ops.auto_fit_columns(ws)
+            else:
+                ws = self._mgr.get_sheet(file_path, sheet)
+                range_ops.auto_fit_columns(ws, range_address)
         if save:
             self._mgr.save_workbook(file_path)
+        message = (
+            f"已自动调整 {len(sheets)} 个工作表的列宽" if sheets else "已自动调整列宽"
+        )
         return format_result(
             True,
             [
                 {
                     "status": "ok",
-                    "message": "已自动调整列宽",
+                    "message": message,
                 }
             ],
             file_saved=save,
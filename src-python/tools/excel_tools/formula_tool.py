@@ -20,6 +20,18 @@ class SetFormulaInput(BaseModel):
     save: bool = Field(default=True, description="设置后是否保存")
 
 
+class FormulaItem(BaseModel):
+    range_address: str = Field(description="设置公式的区域(如'F2:F100')")
+    formula: str = Field(description="公式字符串，使用英文函数名")
+
+
+class SetFormulasInput(BaseModel):
+    file_path: str = Field(description="Excel文件路径")
+    sheet: str | None = Field(default=None, description="工作表名称")
+    formulas: list[FormulaItem] = Field(min_length=1, description="区域与公式列表")
+    save: bool = Field(default=True, description="设置后是否保存")
+
+
 class GetFormulaInput(BaseModel):
     file_path: str = Field(description="Excel文件路径")
     sheet: str | None = Field(default=None, description="工作表名称")
@@ -41,6 +53,15 @@ class FormulaToolProvider:
                 args_schema=SetFormulaInput,
                 func=self._set_formula,
             ),
+            StructuredTool(
+                name="range_set_formulas",
+                description=(
+                    "一次在多个区域设置公式（批量），"
+                    "比多次调用 range_set_formula 更快。使用英文函数名。"
+                ),
+                args_schema=SetFormulasInput,
+                func=self._set_formulas,
+            ),
             StructuredTool(
                 name="get_excel_formula",
                 description="读取Excel单元格或区域中的公式。",
@@ -58,8 +79,9 @@ class FormulaToolProvider:
         sheet: str | None = None,
         save: bool = True,
     ) -> str:
-        ws = self._mgr.get_sheet(file_path, sheet)
-        formula_ops.set_formula(ws, range_address, formula)
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            formula_ops.set_formula(ws, range_address, formula)
         if save:
             self._mgr.save_workbook(file_path)
         return format_result(
@@ -73,6 +95,31 @@ class FormulaToolProvider:
             file_saved=save,
         )
 
+    @safe_excel_call
+    def _set_formulas(
+        self,
+        file_path: str,
+        formulas: list[FormulaItem],
+        sheet: str | None = None,
+        save: bool = True,
+    ) -> str:
+        pairs = [(f.range_address, f.formula) for f in formulas]
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            formula_ops.set_formulas(ws, pairs)
+        if save:
+            self._mgr.save_workbook(file_path)
+        return format_result(
+            True,
+            [
+                {
+                    "status": "ok",
+                    "message": f"已在 {len(pairs)} 个区域设置公式",
+                }
+            ],
+            file_saved=save,
+        )
+
     @safe_excel_call
     def _get_formula(
         self,
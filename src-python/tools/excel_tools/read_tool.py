@@ -20,6 +20,10 @@ class ReadRangeInput(BaseModel):
     range_address: str | None = Field(
         default=None, description="要读取的区域地址(如'A1:D10')，为空则读取已用区域"
     )
+    raw_values: bool = Field(
+        default=False,
+        description="返回原始值(日期为序列号)，读取大量数值时更快",
+    )
 
 
 class ReadToolProvider:
@@ -46,21 +50,24 @@ class ReadToolProvider:
         file_path: str,
         sheet: str | None = None,
         range_address: str | None = None,
+        raw_values: bool = False,
     ) -> str:
         ws = self._mgr.get_sheet(file_path, sheet)
 
         if range_address is None:
-            addr, data, total_rows, total_cols = range_ops.read_used_range(ws)
+            # Only the rows that can be returned are marshalled out of Excel
+            addr, data, total_rows, total_cols = range_ops.read_used_range(
+                ws, max_rows=MAX_RETURN_ROWS, use_value2=raw_values
+            )
         else:
-            data = range_ops.read_range(ws, range_address)
+            data = range_ops.read_range(ws, range_address, use_value2=raw_values)
             addr = range_address
             total_rows = len(data)
             total_cols = len(data[0]) if data else 0
 
-        truncated = False
+        truncated = total_rows > MAX_RETURN_ROWS
         if len(data) > MAX_RETURN_ROWS:
             data = data[:MAX_RETURN_ROWS]
-            truncated = True
 
         result: dict = {
             "status": "ok",
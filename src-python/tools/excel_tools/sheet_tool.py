@@ -87,7 +87,7 @@ class SheetToolProvider:
     @safe_excel_call
     def _delete(self, file_path: str, sheet_name: str, save: bool = True) -> str:
         entry = self._mgr.get_workbook(file_path)
-        sheet_ops.delete_sheet(self._mgr.app, entry.workbook, sheet_name)
+        sheet_ops.delete_sheet(entry.app, entry.workbook, sheet_name)
         if save:
             self._mgr.save_workbook(file_path)
         return format_result(
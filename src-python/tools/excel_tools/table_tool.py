@@ -80,10 +80,11 @@ class TableToolProvider:
         style: str | None = None,
         save: bool = True,
     ) -> str:
-        ws = self._mgr.get_sheet(file_path, sheet)
-        tbl = table_ops.create_table(ws, range_address, table_name, has_headers)
-        if style:
-            table_ops.set_table_style(ws, table_name, style)
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            tbl = table_ops.create_table(ws, range_address, table_name, has_headers)
+            if style:
+                table_ops.set_table_style(ws, table_name, style)
         if save:
             self._mgr.save_workbook(file_path)
         return format_result(
@@ -126,8 +127,9 @@ class TableToolProvider:
         formula: str | None = None,
         save: bool = True,
     ) -> str:
-        ws = self._mgr.get_sheet(file_path, sheet)
-        table_ops.add_table_column(ws, table_name, column_name, formula)
+        with self._mgr.batch_operation(file_path):
+            ws = self._mgr.get_sheet(file_path, sheet)
+            table_ops.add_table_column(ws, table_name, column_name, formula)
         if save:
             self._mgr.save_workbook(file_path)
         msg = f"已添加列 '{column_name}' 到表格 '{table_name}'"
@@ -114,11 +114,15 @@ class WorkbookToolProvider:
     @safe_excel_call
     def _info(self, file_path: str) -> str:
         entry = self._mgr.get_workbook(file_path)
-        wb = entry.workbook
-        sheets = sheet_ops.list_sheets(wb)
+        # One pass over the collection yields each sheet object with its
+        # name, instead of listing names and then looking each one up again
+        sheets: list[str] = []
         tables_info = []
-        for s_name in sheets:
-            ws = wb.Sheets(s_name)
+        coll = entry.sheet_collection
+        for i in range(1, coll.Count + 1):
+            ws = coll(i)
+            s_name = ws.Name
+            sheets.append(s_name)
             for t in table_ops.list_tables(ws):
                 t["sheet"] = s_name
                 tables_info.append(t)
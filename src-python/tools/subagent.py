@@ -15,6 +15,22 @@ class SubAgentInput(BaseModel):
     query: str = Field(description="The task or question to delegate to this subagent")
 
 
+def _extract_response(result: dict) -> str:
+    """Return the text of the subagent's final message."""
+    messages = result.get("messages", [])
+    if not messages:
+        return ""
+    content = messages[-1].content
+    if isinstance(content, list):
+        # One pass, no intermediate list; content lists mix str parts and blocks
+        return "".join(
+            p if type(p) is str else p.get("text", "")
+            for p in content
+            if type(p) is str or (type(p) is dict and p.get("type") == "text")
+        )
+    return str(content)
+
+
 def create_subagent_tool(
     name: str,
     description: str,
@@ -38,30 +54,14 @@ def create_subagent_tool(
             {"messages": [("user", query)]},
             config={"configurable": {"thread_id": "subagent"}},
         )
-        messages = result.get("messages", [])
-        if messages:
-            content = messages[-1].content
-            if isinstance(content, list):
-                return "".join(
-                    p.get("text", "") for p in content if isinstance(p, dict)
-                )
-            return str(content)
-        return ""
+        return _extract_response(result)
 
     async def arun(query: str) -> str:
         result = await agent.ainvoke(
             {"messages": [("user", query)]},
             config={"configurable": {"thread_id": "subagent"}},
         )
-        messages = result.get("messages", [])
-        if messages:
-            content = messages[-1].content
-            if isinstance(content, list):
-                return "".join(
-                    p.get("text", "") for p in content if isinstance(p, dict)
-                )
-            return str(content)
-        return ""
+        return _extract_response(result)
 
     return StructuredTool(
         name=name,
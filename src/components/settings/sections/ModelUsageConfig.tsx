@@ -6,7 +6,14 @@ const NONE = "__none__";
 
 export function ModelUsageConfig() {
   const { t } = useTranslation();
-  const { settings, setMainModelId, setSubagentsModelId, setAnalysisModelId, saveSettings } = useSettingsStore();
+  const {
+    settings,
+    setMainModelId,
+    setSubagentsModelId,
+    setAnalysisModelId,
+    setResponseCacheEnabled,
+    saveSettings,
+  } = useSettingsStore();
 
   const models = settings?.models ?? [];
 
@@ -15,6 +22,11 @@ export function ModelUsageConfig() {
     setTimeout(() => saveSettings(), 0);
   };
 
+  const handleCacheChange = (val: string) => {
+    setResponseCacheEnabled(val === "on");
+    setTimeout(() => saveSettings(), 0);
+  };
+
   const modelLabel = (id: string | null) => {
     if (!id) return NONE;
     const m = models.find((m) => m.id === id);
@@ -69,6 +81,19 @@ export function ModelUsageConfig() {
             </Select>
           </div>
         ))}
+        <div className="flex items-center justify-between px-4 py-3">
+          <div>
+            <p className="text-sm font-medium">{t("settings.usage.responseCache")}</p>
+            <p className="text-xs text-muted-foreground mt-0.5">{t("settings.usage.responseCacheDesc")}</p>
+          </div>
+          <Select value={settings?.response_cache_enabled ? "on" : "off"} onValueChange={handleCacheChange}>
+            <SelectTrigger className="w-52 h-8 text-sm"><SelectValue /></SelectTrigger>
+            <SelectContent>
+              <SelectItem value="off" className="text-sm">{t("settings.usage.disabled")}</SelectItem>
+              <SelectItem value="on" className="text-sm">{t("settings.usage.enabled")}</SelectItem>
+            </SelectContent>
+          </Select>
+        </div>
       </div>
     </div>
   );
@@ -298,6 +298,7 @@ export interface AppSettings {
   subagents_model_id: string | null;
   analysis_model_id: string | null;
   language: string;
+  response_cache_enabled: boolean;
 }
 
 export const settings = {
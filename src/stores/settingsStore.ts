@@ -13,6 +13,7 @@ interface SettingsStore {
   setMainModelId: (id: string | null) => void;
   setSubagentsModelId: (id: string | null) => void;
   setAnalysisModelId: (id: string | null) => void;
+  setResponseCacheEnabled: (enabled: boolean) => void;
 }
 
 export const useSettingsStore = create<SettingsStore>((set, get) => ({
@@ -95,4 +96,10 @@ export const useSettingsStore = create<SettingsStore>((set, get) => ({
     if (!current) return;
     set({ settings: { ...current, analysis_model_id: id } });
   },
+
+  setResponseCacheEnabled: (enabled) => {
+    const current = get().settings;
+    if (!current) return;
+    set({ settings: { ...current, response_cache_enabled: enabled } });
+  },
 }));